@@ -6,14 +6,20 @@ This file demonstrates advanced Abstract Data Type implementations:
 - Multiple queue implementations with trade-offs
 - Stack variations and applications
 - Deque (double-ended queue) implementation
+- Binary-heap priority queues (plain and indexed)
 - Circular buffers and ring queues
+- Persistent (immutable) queues and stacks
 - Container protocol compliance
+- Optional per-operation latency histograms
 
 Author: CSC 242 Teaching Team
 """
 
 from collections import deque as collections_deque
+import heapq
+import sys
 import time
+import weakref
 
 
 # ============================================================================
@@ -23,19 +29,240 @@ import time
 print("📦 ADVANCED CONTAINER ADTs")
 print("=" * 60)
 
-class ListQueue:
-    """Queue using list with front at index 0 (inefficient dequeue)"""
+class LatencyHistogram:
+    """Log-bucketed latency histogram over nanosecond samples (HDR-style)
+    
+    Values below 2**(SUB_BUCKET_BITS + 1) get exact buckets; above that every
+    power of two is split into 2**SUB_BUCKET_BITS sub-buckets, so any
+    reported percentile is within about 6% of the true value while memory
+    stays a few dozen buckets. Histograms with the same layout merge by
+    adding counts.
+    """
+    
+    SUB_BUCKET_BITS = 4
     
     def __init__(self):
+        """Initialize empty histogram"""
+        self._counts = {}  # bucket index -> count
+        self._total = 0
+        self._min = None
+        self._max = None
+    
+    @classmethod
+    def _bucket_index(cls, value):
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS - 1
+        if shift <= 0:
+            return value
+        return (shift << cls.SUB_BUCKET_BITS) + (value >> shift)
+    
+    @classmethod
+    def _bucket_upper(cls, index):
+        """Largest value that falls in bucket index"""
+        limit = 1 << (cls.SUB_BUCKET_BITS + 1)
+        if index < limit:
+            return index
+        shift = (index >> cls.SUB_BUCKET_BITS) - 1
+        top = index - (shift << cls.SUB_BUCKET_BITS)
+        return ((top + 1) << shift) - 1
+    
+    def record(self, value_ns):
+        """Add one sample (negative samples count as zero)"""
+        value_ns = max(0, int(value_ns))
+        index = self._bucket_index(value_ns)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self._total += 1
+        if self._min is None or value_ns < self._min:
+            self._min = value_ns
+        if self._max is None or value_ns > self._max:
+            self._max = value_ns
+    
+    def merge(self, other):
+        """Add another histogram's samples into this one and return self"""
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self._total += other._total
+        if other._min is not None:
+            self._min = other._min if self._min is None else min(self._min, other._min)
+            self._max = other._max if self._max is None else max(self._max, other._max)
+        return self
+    
+    def percentile(self, percent):
+        """Return the value at the given percentile (0-100)"""
+        if self._total == 0:
+            raise ValueError("percentile of empty histogram")
+        if not 0 <= percent <= 100:
+            raise ValueError("percent must be between 0 and 100")
+        
+        rank = max(1, -(-self._total * percent // 100))  # Ceiling division
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._bucket_upper(index), self._max)
+        return self._max
+    
+    def count(self):
+        return self._total
+    
+    def summary(self):
+        """Return count, min, max and p50/p99/p999 in nanoseconds"""
+        if self._total == 0:
+            return {'count': 0}
+        return {
+            'count': self._total,
+            'min_ns': self._min,
+            'p50_ns': self.percentile(50),
+            'p99_ns': self.percentile(99),
+            'p999_ns': self.percentile(99.9),
+            'max_ns': self._max
+        }
+    
+    def __str__(self):
+        return f"LatencyHistogram({self.summary()})"
+
+
+_creation_hooks = []
+
+
+def add_creation_hook(hook):
+    """Call hook(container) whenever a container in this module is created"""
+    _creation_hooks.append(hook)
+
+
+def remove_creation_hook(hook):
+    """Stop calling a hook added with add_creation_hook"""
+    _creation_hooks.remove(hook)
+
+
+class _ObservableType(type):
+    """Metaclass that announces each instance once __init__ has finished"""
+    
+    def __call__(cls, *args, **kwargs):
+        container = super().__call__(*args, **kwargs)
+        for hook in _creation_hooks:
+            hook(container)
+        return container
+
+
+class ObservableContainer(metaclass=_ObservableType):
+    """Root of the mutable container family: announces new instances
+    
+    Hooks run after the instance is fully initialized, so they may call
+    get_stats() or any other method on it.
+    """
+
+
+class LatencyTracked(ObservableContainer):
+    """Mixin adding optional per-operation latency histograms
+    
+    Enabling tracking shadows each method in _TIMED_OPERATIONS with a timing
+    wrapper in the instance dict (and get_stats with one that adds a
+    'latency' section). Only every sample_every-th call is timed. The
+    wrappers hold the container weakly, so tracking never keeps it alive.
+    Disabling removes the wrappers, so an untracked container pays nothing.
+    """
+    
+    _TIMED_OPERATIONS = ()
+    _latency = None  # operation name -> LatencyHistogram while tracking
+    
+    def enable_latency_tracking(self, sample_every=1):
+        """Start timing every sample_every-th call of each operation"""
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        
+        self._latency = {name: LatencyHistogram() for name in self._TIMED_OPERATIONS}
+        self._latency_sample_every = sample_every
+        self._install_timers()
+    
+    def disable_latency_tracking(self):
+        """Stop timing and return the collected histograms"""
+        histograms = self._latency or {}
+        self._latency = None
+        for name in self._TIMED_OPERATIONS + ('get_stats',):
+            self.__dict__.pop(name, None)
+        return histograms
+    
+    def get_latency_histograms(self):
+        """Return the live histograms by operation name (empty if disabled)"""
+        return dict(self._latency or {})
+    
+    def _install_timers(self):
+        owner = weakref.ref(self)
+        cls = type(self)
+        sample_every = self._latency_sample_every
+        latency = self._latency
+        for name in self._TIMED_OPERATIONS:
+            self.__dict__[name] = _timed(owner, getattr(cls, name), latency[name],
+                                         sample_every)
+        
+        base_get_stats = cls.get_stats
+        
+        def get_stats():
+            stats = base_get_stats(owner())
+            stats['latency'] = {name: histogram.summary()
+                                for name, histogram in latency.items()}
+            stats['latency_sample_every'] = sample_every
+            return stats
+        self.__dict__['get_stats'] = get_stats
+
+
+def _timed(owner, operation, histogram, sample_every):
+    """Wrap the class function operation so every sample_every-th call is timed
+    
+    owner is a weak reference to the container, passed to operation on each
+    call; holding a bound method instead would make a reference cycle.
+    """
+    countdown = sample_every
+    
+    def timed(*args, **kwargs):
+        nonlocal countdown
+        countdown -= 1
+        if countdown:
+            return operation(owner(), *args, **kwargs)
+        countdown = sample_every
+        start = time.perf_counter_ns()
+        try:
+            return operation(owner(), *args, **kwargs)
+        finally:
+            histogram.record(time.perf_counter_ns() - start)
+    return timed
+
+
+class InstrumentedContainer(LatencyTracked):
+    """Mixin for containers whose operation counters can be switched off
+    
+    The counted operations update their counters only while the instance's
+    _instrumented flag is set, so a disabled container skips every counter
+    update at the cost of one attribute check per call.
+    """
+    
+    _instrumented = True
+    
+    def set_instrumented(self, enabled):
+        """Turn operation counting on or off"""
+        self._instrumented = bool(enabled)
+    
+    def is_instrumented(self):
+        return self._instrumented
+
+
+class ListQueue(InstrumentedContainer):
+    """Queue using list with front at index 0 (inefficient dequeue)"""
+    
+    _TIMED_OPERATIONS = ('enqueue', 'dequeue', 'front')
+    
+    def __init__(self, instrumented=True):
         """Initialize empty queue"""
         self._items = []
         self._enqueue_count = 0
         self._dequeue_count = 0
+        self.set_instrumented(instrumented)
     
     def enqueue(self, item):
         """Add item to rear (efficient - O(1))"""
         self._items.append(item)
-        self._enqueue_count += 1
+        if self._instrumented:
+            self._enqueue_count += 1
     
     def dequeue(self):
         """Remove item from front (inefficient - O(n))"""
@@ -43,7 +270,8 @@ class ListQueue:
             raise IndexError("dequeue from empty queue")
         
         item = self._items.pop(0)  # O(n) operation!
-        self._dequeue_count += 1
+        if self._instrumented:
+            self._dequeue_count += 1
         return item
     
     def front(self):
@@ -63,6 +291,7 @@ class ListQueue:
         return {
             'type': 'ListQueue',
             'size': len(self._items),
+            'instrumented': self._instrumented,
             'enqueue_count': self._enqueue_count,
             'dequeue_count': self._dequeue_count,
             'efficiency': 'O(1) enqueue, O(n) dequeue'
@@ -72,19 +301,23 @@ class ListQueue:
         return f"ListQueue({self._items})"
 
 
-class ReverseListQueue:
+class ReverseListQueue(InstrumentedContainer):
     """Queue using list with front at end (inefficient enqueue)"""
     
-    def __init__(self):
+    _TIMED_OPERATIONS = ('enqueue', 'dequeue', 'front')
+    
+    def __init__(self, instrumented=True):
         """Initialize empty queue"""
         self._items = []
         self._enqueue_count = 0
         self._dequeue_count = 0
+        self.set_instrumented(instrumented)
     
     def enqueue(self, item):
         """Add item to rear at index 0 (inefficient - O(n))"""
         self._items.insert(0, item)  # O(n) operation!
-        self._enqueue_count += 1
+        if self._instrumented:
+            self._enqueue_count += 1
     
     def dequeue(self):
         """Remove item from front at end (efficient - O(1))"""
@@ -92,7 +325,8 @@ class ReverseListQueue:
             raise IndexError("dequeue from empty queue")
         
         item = self._items.pop()  # O(1) operation
-        self._dequeue_count += 1
+        if self._instrumented:
+            self._dequeue_count += 1
         return item
     
     def front(self):
@@ -112,6 +346,7 @@ class ReverseListQueue:
         return {
             'type': 'ReverseListQueue',
             'size': len(self._items),
+            'instrumented': self._instrumented,
             'enqueue_count': self._enqueue_count,
             'dequeue_count': self._dequeue_count,
             'efficiency': 'O(n) enqueue, O(1) dequeue'
@@ -122,21 +357,31 @@ class ReverseListQueue:
         return f"ReverseListQueue({list(reversed(self._items))})"
 
 
-class TwoStackQueue:
+class TwoStackQueue(InstrumentedContainer):
     """Queue implemented using two stacks (amortized O(1))"""
     
-    def __init__(self):
+    _TIMED_OPERATIONS = ('enqueue', 'dequeue', 'front')
+    
+    def __init__(self, instrumented=True):
         """Initialize with two stacks"""
         self._enqueue_stack = []  # For new items
         self._dequeue_stack = []  # For removing items
         self._enqueue_count = 0
         self._dequeue_count = 0
         self._transfer_count = 0
+        self.set_instrumented(instrumented)
+    
+    def _transfer(self):
+        """Move the enqueue stack onto the dequeue stack in one step"""
+        self._transfer_count += len(self._enqueue_stack)
+        self._dequeue_stack.extend(reversed(self._enqueue_stack))
+        self._enqueue_stack.clear()
     
     def enqueue(self, item):
         """Add item to enqueue stack (O(1))"""
         self._enqueue_stack.append(item)
-        self._enqueue_count += 1
+        if self._instrumented:
+            self._enqueue_count += 1
     
     def dequeue(self):
         """Remove item, transferring if needed (amortized O(1))"""
@@ -145,12 +390,11 @@ class TwoStackQueue:
         
         # Transfer items if dequeue stack is empty
         if not self._dequeue_stack:
-            while self._enqueue_stack:
-                self._dequeue_stack.append(self._enqueue_stack.pop())
-                self._transfer_count += 1
+            self._transfer()
         
         item = self._dequeue_stack.pop()
-        self._dequeue_count += 1
+        if self._instrumented:
+            self._dequeue_count += 1
         return item
     
     def front(self):
@@ -160,9 +404,7 @@ class TwoStackQueue:
         
         # Transfer if needed to see front item
         if not self._dequeue_stack:
-            while self._enqueue_stack:
-                self._dequeue_stack.append(self._enqueue_stack.pop())
-                self._transfer_count += 1
+            self._transfer()
         
         return self._dequeue_stack[-1]
     
@@ -177,6 +419,7 @@ class TwoStackQueue:
         return {
             'type': 'TwoStackQueue',
             'size': self.size(),
+            'instrumented': self._instrumented,
             'enqueue_count': self._enqueue_count,
             'dequeue_count': self._dequeue_count,
             'transfer_count': self._transfer_count,
@@ -193,10 +436,12 @@ class TwoStackQueue:
 # CIRCULAR BUFFER QUEUE
 # ============================================================================
 
-class CircularQueue:
+class CircularQueue(InstrumentedContainer):
     """Queue using circular buffer for maximum efficiency"""
     
-    def __init__(self, capacity):
+    _TIMED_OPERATIONS = ('enqueue', 'dequeue', 'front')
+    
+    def __init__(self, capacity, instrumented=True):
         """Initialize with fixed capacity"""
         if capacity <= 0:
             raise ValueError("Capacity must be positive")
@@ -208,6 +453,7 @@ class CircularQueue:
         self._rear = 0
         self._enqueue_count = 0
         self._dequeue_count = 0
+        self.set_instrumented(instrumented)
     
     def enqueue(self, item):
         """Add item to rear (O(1))"""
@@ -217,7 +463,8 @@ class CircularQueue:
         self._buffer[self._rear] = item
         self._rear = (self._rear + 1) % self._capacity
         self._size += 1
-        self._enqueue_count += 1
+        if self._instrumented:
+            self._enqueue_count += 1
     
     def dequeue(self):
         """Remove item from front (O(1))"""
@@ -228,7 +475,8 @@ class CircularQueue:
         self._buffer[self._front] = None  # Help garbage collection
         self._front = (self._front + 1) % self._capacity
         self._size -= 1
-        self._dequeue_count += 1
+        if self._instrumented:
+            self._dequeue_count += 1
         return item
     
     def front(self):
@@ -255,6 +503,7 @@ class CircularQueue:
             'type': 'CircularQueue',
             'size': self._size,
             'capacity': self._capacity,
+            'instrumented': self._instrumented,
             'utilization': f"{(self._size/self._capacity)*100:.1f}%",
             'enqueue_count': self._enqueue_count,
             'dequeue_count': self._dequeue_count,
@@ -288,77 +537,376 @@ class CircularQueue:
 # DEQUE IMPLEMENTATION
 # ============================================================================
 
-class Deque:
-    """Double-ended queue implementation"""
+class _DequeBlock:
+    """Fixed-size chunk of deque storage in a doubly linked list"""
     
-    def __init__(self):
-        """Initialize empty deque"""
-        self._items = []
+    __slots__ = ('items', 'prev', 'next')
+    
+    def __init__(self, block_size):
+        self.items = [None] * block_size
+        self.prev = None
+        self.next = None
+
+
+class Deque(InstrumentedContainer):
+    """Double-ended queue on block-linked storage (O(1) at both ends)
+    
+    Items live in fixed-size blocks chained in a doubly linked list, the same
+    layout collections.deque uses. Growing at either end fills the end block
+    and links a new one when it runs out; emptied blocks go onto a small
+    free-list so steady-state traffic does not allocate.
+    
+    With indexed=True a hash-based multiset of the contents is kept in step
+    with every end operation, making membership and count() O(1) for
+    hashable items at the cost of one dict entry per distinct item.
+    Unhashable items are accepted but only counted; while any are present,
+    membership and count() fall back to an O(n) scan.
+    
+    With instrumented=False the end operations skip the per-operation
+    counters (see InstrumentedContainer).
+    """
+    
+    BLOCK_SIZE = 64
+    MAX_FREE_BLOCKS = 16
+    _TIMED_OPERATIONS = ('add_front', 'add_rear', 'remove_front', 'remove_rear')
+    
+    def __init__(self, indexed=False, instrumented=True):
+        """Initialize empty deque, optionally with a membership index"""
+        self._counts = {} if indexed else None  # item -> occurrences
+        self._unhashable = 0  # Indexed-mode items that could not be hashed
+        self._free_blocks = []
+        self._block_count = 0
+        self._reset()
         self._operations = {
             'add_front': 0,
             'add_rear': 0,
             'remove_front': 0,
             'remove_rear': 0
         }
+        self.set_instrumented(instrumented)
+    
+    def _reset(self):
+        """Start over with one block and both ends meeting in its middle"""
+        self._left = self._right = self._new_block()
+        self._block_count = 1
+        center = (self.BLOCK_SIZE - 1) // 2
+        self._left_index = center + 1
+        self._right_index = center
+        self._size = 0
+        if self._counts is not None:
+            self._counts.clear()
+            self._unhashable = 0
+    
+    def _new_block(self):
+        """Take a block from the free-list or allocate one"""
+        self._block_count += 1
+        if self._free_blocks:
+            return self._free_blocks.pop()
+        return _DequeBlock(self.BLOCK_SIZE)
+    
+    def _free_block(self, block):
+        """Unlink an empty block and keep it for reuse"""
+        self._block_count -= 1
+        block.prev = block.next = None
+        if len(self._free_blocks) < self.MAX_FREE_BLOCKS:
+            self._free_blocks.append(block)
     
     def add_front(self, item):
-        """Add item to front"""
-        self._items.insert(0, item)
-        self._operations['add_front'] += 1
+        """Add item to front (O(1))"""
+        if self._counts is not None:
+            self._index_add(item)
+        if self._left_index == 0:
+            block = self._new_block()
+            block.next = self._left
+            self._left.prev = block
+            self._left = block
+            self._left_index = self.BLOCK_SIZE
+        self._left_index -= 1
+        self._left.items[self._left_index] = item
+        self._size += 1
+        if self._instrumented:
+            self._operations['add_front'] += 1
     
     def add_rear(self, item):
-        """Add item to rear"""
-        self._items.append(item)
-        self._operations['add_rear'] += 1
+        """Add item to rear (O(1))"""
+        if self._counts is not None:
+            self._index_add(item)
+        if self._right_index == self.BLOCK_SIZE - 1:
+            block = self._new_block()
+            block.prev = self._right
+            self._right.next = block
+            self._right = block
+            self._right_index = -1
+        self._right_index += 1
+        self._right.items[self._right_index] = item
+        self._size += 1
+        if self._instrumented:
+            self._operations['add_rear'] += 1
     
     def remove_front(self):
-        """Remove and return item from front"""
-        if not self._items:
+        """Remove and return item from front (O(1))"""
+        if self._size == 0:
             raise IndexError("remove_front from empty deque")
         
-        item = self._items.pop(0)
-        self._operations['remove_front'] += 1
+        block = self._left
+        item = block.items[self._left_index]
+        block.items[self._left_index] = None  # Help garbage collection
+        self._left_index += 1
+        self._size -= 1
+        if self._instrumented:
+            self._operations['remove_front'] += 1
+        if self._counts is not None:
+            self._discard_count(item)
+        
+        if self._size == 0:
+            center = (self.BLOCK_SIZE - 1) // 2
+            self._left_index = center + 1
+            self._right_index = center
+        elif self._left_index == self.BLOCK_SIZE:
+            self._left = block.next
+            self._left.prev = None
+            self._left_index = 0
+            self._free_block(block)
         return item
     
     def remove_rear(self):
-        """Remove and return item from rear"""
-        if not self._items:
+        """Remove and return item from rear (O(1))"""
+        if self._size == 0:
             raise IndexError("remove_rear from empty deque")
         
-        item = self._items.pop()
-        self._operations['remove_rear'] += 1
+        block = self._right
+        item = block.items[self._right_index]
+        block.items[self._right_index] = None  # Help garbage collection
+        self._right_index -= 1
+        self._size -= 1
+        if self._instrumented:
+            self._operations['remove_rear'] += 1
+        if self._counts is not None:
+            self._discard_count(item)
+        
+        if self._size == 0:
+            center = (self.BLOCK_SIZE - 1) // 2
+            self._left_index = center + 1
+            self._right_index = center
+        elif self._right_index < 0:
+            self._right = block.prev
+            self._right.next = None
+            self._right_index = self.BLOCK_SIZE - 1
+            self._free_block(block)
         return item
     
+    def _index_add(self, item):
+        """Add one occurrence of item to the membership index"""
+        try:
+            self._counts[item] = self._counts.get(item, 0) + 1
+        except TypeError:
+            self._unhashable += 1
+    
+    def _discard_count(self, item):
+        """Drop one occurrence of item from the membership index"""
+        try:
+            remaining = self._counts[item] - 1
+        except TypeError:
+            self._unhashable -= 1
+            return
+        if remaining:
+            self._counts[item] = remaining
+        else:
+            del self._counts[item]
+    
     def front(self):
         """Peek at front item"""
-        if not self._items:
+        if self._size == 0:
             raise IndexError("front of empty deque")
-        return self._items[0]
+        return self._left.items[self._left_index]
     
     def rear(self):
         """Peek at rear item"""
-        if not self._items:
+        if self._size == 0:
             raise IndexError("rear of empty deque")
-        return self._items[-1]
+        return self._right.items[self._right_index]
     
     def is_empty(self):
-        return len(self._items) == 0
+        return self._size == 0
     
     def size(self):
-        return len(self._items)
+        return self._size
     
     def clear(self):
         """Remove all items"""
-        self._items.clear()
+        self._reset()
+    
+    def rotate(self, k=1):
+        """Rotate k steps to the right (negative k rotates left)
+        
+        Cost is O(min(k, n - k)). Items move between the end blocks a slice
+        at a time, and once both ends sit on block boundaries whole blocks
+        are relinked from one end to the other without touching their items.
+        """
+        n = self._size
+        if n <= 1:
+            return
+        half = n >> 1
+        if k > half or k < -half:
+            k %= n
+            if k > half:
+                k -= n
+        
+        B = self.BLOCK_SIZE
+        while k > 0:
+            # Move items from the rear to the front
+            if self._left_index == 0:
+                if (self._right_index == B - 1 and k >= B
+                        and self._left is not self._right):
+                    block = self._right
+                    self._right = block.prev
+                    self._right.next = None
+                    block.prev = None
+                    block.next = self._left
+                    self._left.prev = block
+                    self._left = block
+                    k -= B
+                    continue
+                block = self._new_block()
+                block.next = self._left
+                self._left.prev = block
+                self._left = block
+                self._left_index = B
+            
+            m = min(k, self._left_index, self._right_index + 1)
+            li, ri = self._left_index, self._right_index
+            self._left.items[li - m:li] = self._right.items[ri - m + 1:ri + 1]
+            self._right.items[ri - m + 1:ri + 1] = [None] * m
+            self._left_index -= m
+            self._right_index -= m
+            k -= m
+            
+            if self._right_index < 0:
+                block = self._right
+                self._right = block.prev
+                self._right.next = None
+                self._right_index = B - 1
+                self._free_block(block)
+        
+        while k < 0:
+            # Move items from the front to the rear
+            if self._right_index == B - 1:
+                if (self._left_index == 0 and -k >= B
+                        and self._left is not self._right):
+                    block = self._left
+                    self._left = block.next
+                    self._left.prev = None
+                    block.next = None
+                    block.prev = self._right
+                    self._right.next = block
+                    self._right = block
+                    k += B
+                    continue
+                block = self._new_block()
+                block.prev = self._right
+                self._right.next = block
+                self._right = block
+                self._right_index = -1
+            
+            m = min(-k, B - 1 - self._right_index, B - self._left_index)
+            li, ri = self._left_index, self._right_index
+            self._right.items[ri + 1:ri + 1 + m] = self._left.items[li:li + m]
+            self._left.items[li:li + m] = [None] * m
+            self._left_index += m
+            self._right_index += m
+            k += m
+            
+            if self._left_index == B:
+                block = self._left
+                self._left = block.next
+                self._left.prev = None
+                self._left_index = 0
+                self._free_block(block)
+    
+    def _locate(self, index):
+        """Return (block, offset) of a valid non-negative logical index
+        
+        Walks from whichever end is nearer, so items near either end are
+        found in O(1) and the middle costs O(n/B) block hops.
+        """
+        B = self.BLOCK_SIZE
+        if index < (self._size >> 1):
+            block = self._left
+            offset = self._left_index + index
+            while offset >= B:
+                block = block.next
+                offset -= B
+        else:
+            block = self._right
+            offset = self._right_index - (self._size - 1 - index)
+            while offset < 0:
+                block = block.prev
+                offset += B
+        return block, offset
+    
+    def _copy_range(self, start, stop):
+        """Copy logical positions [start, stop) into a list, block by block"""
+        result = []
+        remaining = stop - start
+        if remaining <= 0:
+            return result
+        block, offset = self._locate(start)
+        while remaining:
+            end = min(self.BLOCK_SIZE, offset + remaining)
+            result += block.items[offset:end]
+            remaining -= end - offset
+            block = block.next
+            offset = 0
+        return result
+    
+    def _bulk_add_rear(self, items):
+        """Append a list of items by filling whole block slices at once"""
+        if self._counts is not None:
+            for item in items:
+                self._index_add(item)
+        B = self.BLOCK_SIZE
+        position = 0
+        while position < len(items):
+            if self._right_index == B - 1:
+                block = self._new_block()
+                block.prev = self._right
+                self._right.next = block
+                self._right = block
+                self._right_index = -1
+            start = self._right_index + 1
+            count = min(B - start, len(items) - position)
+            self._right.items[start:start + count] = items[position:position + count]
+            self._right_index += count
+            self._size += count
+            position += count
+    
+    def count(self, item):
+        """Count occurrences of item (O(1) when indexed, O(n) otherwise)"""
+        if self._counts is not None and not self._unhashable:
+            try:
+                return self._counts.get(item, 0)
+            except TypeError:
+                return 0  # Unhashable, and no unhashable items are stored
+        return sum(1 for x in self if x is item or x == item)
     
     def get_stats(self):
         """Return operation statistics"""
-        return {
+        stats = {
             'type': 'Deque',
-            'size': len(self._items),
+            'size': self._size,
+            'block_size': self.BLOCK_SIZE,
+            'blocks': self._block_count,
+            'free_blocks': len(self._free_blocks),
+            'instrumented': self._instrumented,
             'operations': self._operations.copy(),
-            'total_operations': sum(self._operations.values())
+            'total_operations': sum(self._operations.values()),
+            'indexed': self._counts is not None
         }
+        if self._counts is not None:
+            stats['index_entries'] = len(self._counts)
+            stats['index_unhashable'] = self._unhashable
+            stats['index_bytes'] = sys.getsizeof(self._counts)
+        return stats
     
     # Support queue interface
     def enqueue(self, item):
@@ -383,69 +931,367 @@ class Deque:
         return self.rear()
     
     def __iter__(self):
-        """Iterate from front to rear"""
-        return iter(self._items)
+        """Iterate from front to rear, one block slice at a time"""
+        block = self._left
+        start = self._left_index
+        remaining = self._size
+        while remaining:
+            stop = min(self.BLOCK_SIZE, start + remaining)
+            yield from block.items[start:stop]
+            remaining -= stop - start
+            block = block.next
+            start = 0
     
     def __len__(self):
-        return len(self._items)
+        return self._size
+    
+    def __getitem__(self, index):
+        """Index from either end, or slice into a new Deque"""
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._size))
+            result = Deque(indexed=self._counts is not None,
+                           instrumented=self._instrumented)
+            if positions:
+                low = min(positions[0], positions[-1])
+                high = max(positions[0], positions[-1]) + 1
+                result._bulk_add_rear(self._copy_range(low, high)[::index.step or 1])
+            return result
+        
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("deque index out of range")
+        block, offset = self._locate(index)
+        return block.items[offset]
     
     def __contains__(self, item):
-        return item in self._items
+        if self._counts is not None and not self._unhashable:
+            try:
+                return item in self._counts
+            except TypeError:
+                return False  # Unhashable, and no unhashable items are stored
+        return item in iter(self)
     
     def __str__(self):
-        return f"Deque({self._items})"
+        return f"Deque({list(self)})"
     
     def __repr__(self):
-        return f"Deque({self._items!r})"
+        return f"Deque({list(self)!r})"
+
+
+# ============================================================================
+# PRIORITY QUEUE
+# ============================================================================
+
+class PriorityQueue(LatencyTracked):
+    """Binary-heap priority queue (lowest priority value dequeued first)
+    
+    Entries are (priority, sequence, item) triples, so items with equal
+    priority come out in FIFO order and items themselves are never compared.
+    """
+    
+    _TIMED_OPERATIONS = ('enqueue', 'dequeue', 'push_pop', 'replace')
+    
+    def __init__(self, items=None):
+        """Initialize empty, or in O(n) from an iterable of (item, priority)"""
+        self._heap = []
+        self._sequence = 0
+        self._enqueue_count = 0
+        self._dequeue_count = 0
+        if items is not None:
+            for item, priority in items:
+                self._heap.append((priority, self._sequence, item))
+                self._sequence += 1
+            heapq.heapify(self._heap)
+            self._enqueue_count = len(self._heap)
+    
+    def _entry(self, item, priority):
+        entry = (priority, self._sequence, item)
+        self._sequence += 1
+        return entry
+    
+    def enqueue(self, item, priority):
+        """Add item with the given priority (O(log n))"""
+        heapq.heappush(self._heap, self._entry(item, priority))
+        self._enqueue_count += 1
+    
+    def dequeue(self):
+        """Remove and return the highest-priority item (O(log n))"""
+        if not self._heap:
+            raise IndexError("dequeue from empty priority queue")
+        
+        item = heapq.heappop(self._heap)[2]
+        self._dequeue_count += 1
+        return item
+    
+    def push_pop(self, item, priority):
+        """Enqueue item, then dequeue and return the best item (one sift)"""
+        result = heapq.heappushpop(self._heap, self._entry(item, priority))[2]
+        self._enqueue_count += 1
+        self._dequeue_count += 1
+        return result
+    
+    def replace(self, item, priority):
+        """Dequeue and return the best item, then enqueue item (one sift)"""
+        if not self._heap:
+            raise IndexError("replace on empty priority queue")
+        
+        result = heapq.heapreplace(self._heap, self._entry(item, priority))[2]
+        self._enqueue_count += 1
+        self._dequeue_count += 1
+        return result
+    
+    def front(self):
+        """Peek at the highest-priority item"""
+        if not self._heap:
+            raise IndexError("front of empty priority queue")
+        return self._heap[0][2]
+    
+    def front_priority(self):
+        """Peek at the priority of the front item"""
+        if not self._heap:
+            raise IndexError("front of empty priority queue")
+        return self._heap[0][0]
+    
+    def is_empty(self):
+        return len(self._heap) == 0
+    
+    def size(self):
+        return len(self._heap)
+    
+    def get_stats(self):
+        """Return performance statistics"""
+        return {
+            'type': 'PriorityQueue',
+            'size': len(self._heap),
+            'enqueue_count': self._enqueue_count,
+            'dequeue_count': self._dequeue_count,
+            'efficiency': 'O(log n) enqueue/dequeue, O(1) front, O(n) bulk build'
+        }
+    
+    def __len__(self):
+        return len(self._heap)
+    
+    def __iter__(self):
+        """Iterate in priority order without removing (O(n log n))"""
+        return (entry[2] for entry in sorted(self._heap))
+    
+    def __str__(self):
+        return f"PriorityQueue({list(self)})"
+
+
+class IndexedPriorityQueue(LatencyTracked):
+    """Priority queue with handles for O(log n) update and remove
+    
+    enqueue() returns a handle that stays valid until its item leaves the
+    queue. A position map from handle to heap index lets update_priority()
+    and remove() find their entry directly instead of searching the heap.
+    """
+    
+    _TIMED_OPERATIONS = ('enqueue', 'dequeue', 'update_priority', 'remove')
+    
+    def __init__(self):
+        """Initialize empty indexed priority queue"""
+        self._heap = []      # Entries: [priority, handle, item]
+        self._position = {}  # handle -> index in _heap
+        self._next_handle = 0
+        self._stats = {
+            'enqueue_count': 0,
+            'dequeue_count': 0,
+            'update_count': 0,
+            'remove_count': 0,
+            'sift_up_count': 0,
+            'sift_down_count': 0,
+            'swap_count': 0
+        }
+    
+    @staticmethod
+    def _less(a, b):
+        # Handles increase monotonically, so they double as the FIFO tie-break
+        return a[0] < b[0] or (a[0] == b[0] and a[1] < b[1])
+    
+    def _sift_up(self, index):
+        """Move the entry at index toward the root until the heap is valid"""
+        heap = self._heap
+        entry = heap[index]
+        self._stats['sift_up_count'] += 1
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if not self._less(entry, parent):
+                break
+            heap[index] = parent
+            self._position[parent[1]] = index
+            index = parent_index
+            self._stats['swap_count'] += 1
+        heap[index] = entry
+        self._position[entry[1]] = index
+    
+    def _sift_down(self, index):
+        """Move the entry at index toward the leaves until the heap is valid"""
+        heap = self._heap
+        size = len(heap)
+        entry = heap[index]
+        self._stats['sift_down_count'] += 1
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            right_index = child_index + 1
+            if right_index < size and self._less(heap[right_index], heap[child_index]):
+                child_index = right_index
+            child = heap[child_index]
+            if not self._less(child, entry):
+                break
+            heap[index] = child
+            self._position[child[1]] = index
+            index = child_index
+            self._stats['swap_count'] += 1
+        heap[index] = entry
+        self._position[entry[1]] = index
+    
+    def _restore(self, index):
+        """Sift whichever way the entry at index needs to go"""
+        if index > 0 and self._less(self._heap[index], self._heap[(index - 1) >> 1]):
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+    
+    def _detach(self, index):
+        """Remove and return the entry at index, refilling the hole (O(log n))"""
+        entry = self._heap[index]
+        del self._position[entry[1]]
+        last = self._heap.pop()
+        if index < len(self._heap):
+            self._heap[index] = last
+            self._position[last[1]] = index
+            self._restore(index)
+        return entry
+    
+    def enqueue(self, item, priority):
+        """Add item and return its handle (O(log n))"""
+        handle = self._next_handle
+        self._next_handle += 1
+        self._heap.append([priority, handle, item])
+        self._sift_up(len(self._heap) - 1)
+        self._stats['enqueue_count'] += 1
+        return handle
+    
+    def dequeue(self):
+        """Remove and return the highest-priority item (O(log n))"""
+        if not self._heap:
+            raise IndexError("dequeue from empty priority queue")
+        
+        self._stats['dequeue_count'] += 1
+        return self._detach(0)[2]
+    
+    def update_priority(self, handle, priority):
+        """Change the priority of a queued item (O(log n))"""
+        index = self._position.get(handle)
+        if index is None:
+            raise KeyError(f"unknown handle: {handle}")
+        
+        self._heap[index][0] = priority
+        self._restore(index)
+        self._stats['update_count'] += 1
+    
+    def remove(self, handle):
+        """Remove a queued item by handle and return it (O(log n))"""
+        index = self._position.get(handle)
+        if index is None:
+            raise KeyError(f"unknown handle: {handle}")
+        
+        self._stats['remove_count'] += 1
+        return self._detach(index)[2]
+    
+    def priority(self, handle):
+        """Return the current priority of a queued item"""
+        index = self._position.get(handle)
+        if index is None:
+            raise KeyError(f"unknown handle: {handle}")
+        return self._heap[index][0]
+    
+    def front(self):
+        """Peek at the highest-priority item"""
+        if not self._heap:
+            raise IndexError("front of empty priority queue")
+        return self._heap[0][2]
+    
+    def front_handle(self):
+        """Peek at the handle of the highest-priority item"""
+        if not self._heap:
+            raise IndexError("front of empty priority queue")
+        return self._heap[0][1]
+    
+    def is_empty(self):
+        return len(self._heap) == 0
+    
+    def size(self):
+        return len(self._heap)
+    
+    def get_stats(self):
+        """Return performance statistics"""
+        stats = {'type': 'IndexedPriorityQueue', 'size': len(self._heap)}
+        stats.update(self._stats)
+        stats['efficiency'] = 'O(log n) enqueue/dequeue/update/remove'
+        return stats
+    
+    def __contains__(self, handle):
+        return handle in self._position
+    
+    def __len__(self):
+        return len(self._heap)
+    
+    def __str__(self):
+        items = [entry[2] for entry in sorted(self._heap, key=lambda e: (e[0], e[1]))]
+        return f"IndexedPriorityQueue({items})"
 
 
 # ============================================================================
 # STACK VARIATIONS
 # ============================================================================
 
-class MonitoredStack:
+class MonitoredStack(InstrumentedContainer):
     """Stack with operation monitoring and statistics"""
     
-    def __init__(self, max_size=None):
+    _TIMED_OPERATIONS = ('push', 'pop', 'peek')
+    
+    def __init__(self, max_size=None, instrumented=True):
         """Initialize stack with optional size limit"""
         self._items = []
         self._max_size = max_size
-        self._stats = {
-            'push_count': 0,
-            'pop_count': 0,
-            'peek_count': 0,
-            'max_size_reached': 0
-        }
-        self._peak_size = 0
+        self.reset_stats()
+        self.set_instrumented(instrumented)
     
     def push(self, item):
         """Push item onto stack"""
-        if self._max_size and len(self._items) >= self._max_size:
-            self._stats['max_size_reached'] += 1
+        items = self._items
+        if self._max_size and len(items) >= self._max_size:
+            self._max_size_reached += 1
             raise OverflowError(f"Stack overflow (max size: {self._max_size})")
         
-        self._items.append(item)
-        self._stats['push_count'] += 1
-        
-        # Update peak size
-        if len(self._items) > self._peak_size:
-            self._peak_size = len(self._items)
+        items.append(item)
+        if self._instrumented:
+            self._push_count += 1
+            if len(items) > self._peak_size:
+                self._peak_size = len(items)
     
     def pop(self):
         """Pop item from stack"""
         if not self._items:
             raise IndexError("pop from empty stack")
         
-        item = self._items.pop()
-        self._stats['pop_count'] += 1
-        return item
+        if self._instrumented:
+            self._pop_count += 1
+        return self._items.pop()
     
     def peek(self):
         """Peek at top item"""
         if not self._items:
             raise IndexError("peek at empty stack")
         
-        self._stats['peek_count'] += 1
+        if self._instrumented:
+            self._peek_count += 1
         return self._items[-1]
     
     def is_empty(self):
@@ -467,18 +1313,22 @@ class MonitoredStack:
             'current_size': len(self._items),
             'peak_size': self._peak_size,
             'max_size': self._max_size,
-            'operations': self._stats.copy(),
+            'instrumented': self._instrumented,
+            'operations': {
+                'push_count': self._push_count,
+                'pop_count': self._pop_count,
+                'peek_count': self._peek_count,
+                'max_size_reached': self._max_size_reached
+            },
             'utilization': f"{(len(self._items)/(self._max_size or len(self._items) or 1))*100:.1f}%"
         }
     
     def reset_stats(self):
         """Reset all statistics"""
-        self._stats = {
-            'push_count': 0,
-            'pop_count': 0,
-            'peek_count': 0,
-            'max_size_reached': 0
-        }
+        self._push_count = 0
+        self._pop_count = 0
+        self._peek_count = 0
+        self._max_size_reached = 0
         self._peak_size = len(self._items)
     
     def __iter__(self):
@@ -494,74 +1344,448 @@ class MonitoredStack:
         return f"MonitoredStack(top={self.peek()}, size={len(self._items)})"
 
 
+class MinMaxStack(MonitoredStack):
+    """MonitoredStack that answers min() and max() in O(1)
+    
+    Two auxiliary monotonic stacks hold [value, count] pairs for the running
+    minimum and maximum. A new pair is only added when a strictly new extreme
+    is pushed; repeats of the current extreme just bump its count.
+    """
+    
+    def __init__(self, max_size=None, instrumented=True):
+        """Initialize stack with optional size limit"""
+        self._mins = []   # Strictly decreasing from bottom to top
+        self._maxes = []  # Strictly increasing from bottom to top
+        super().__init__(max_size, instrumented)
+    
+    def _compare_extremes(self, item):
+        """Compare item with the current extremes without changing anything
+        
+        Returns (new_min, repeat_min, new_max, repeat_max). An item that
+        cannot be compared raises here, before the stack is touched.
+        """
+        mins, maxes = self._mins, self._maxes
+        new_min = not mins or item < mins[-1][0]
+        repeat_min = not new_min and item == mins[-1][0]
+        new_max = not maxes or item > maxes[-1][0]
+        repeat_max = not new_max and item == maxes[-1][0]
+        return new_min, repeat_min, new_max, repeat_max
+    
+    def _track_push(self, item, new_min, repeat_min, new_max, repeat_max):
+        if new_min:
+            self._mins.append([item, 1])
+        elif repeat_min:
+            self._mins[-1][1] += 1
+        
+        if new_max:
+            self._maxes.append([item, 1])
+        elif repeat_max:
+            self._maxes[-1][1] += 1
+    
+    def _track_pop(self, item):
+        # An item equal to the current extreme was counted when it was pushed
+        for extremes in (self._mins, self._maxes):
+            top = extremes[-1]
+            if item == top[0]:
+                top[1] -= 1
+                if not top[1]:
+                    extremes.pop()
+    
+    def push(self, item):
+        """Push item onto stack, updating the extremes
+        
+        The comparisons run first, so an item that cannot be compared with
+        the current extremes raises TypeError and leaves the stack unchanged.
+        """
+        changes = self._compare_extremes(item)
+        super().push(item)
+        self._track_push(item, *changes)
+    
+    def pop(self):
+        """Pop item from stack, updating the extremes"""
+        item = super().pop()
+        self._track_pop(item)
+        return item
+    
+    def min(self):
+        """Return the smallest item on the stack (O(1))"""
+        if not self._mins:
+            raise IndexError("min of empty stack")
+        return self._mins[-1][0]
+    
+    def max(self):
+        """Return the largest item on the stack (O(1))"""
+        if not self._maxes:
+            raise IndexError("max of empty stack")
+        return self._maxes[-1][0]
+    
+    def get_stats(self):
+        """Get comprehensive statistics, including auxiliary stack sizes"""
+        stats = super().get_stats()
+        stats['type'] = 'MinMaxStack'
+        stats['min_entries'] = len(self._mins)
+        stats['max_entries'] = len(self._maxes)
+        return stats
+    
+    def __str__(self):
+        if self.is_empty():
+            return "MinMaxStack(empty)"
+        return (f"MinMaxStack(top={self._items[-1]}, min={self.min()}, "
+                f"max={self.max()}, size={len(self._items)})")
+
+
 # ============================================================================
-# PERFORMANCE COMPARISON
+# PERSISTENT (IMMUTABLE) CONTAINERS
 # ============================================================================
 
-def performance_comparison():
-    """Compare performance of different queue implementations"""
-    print("\n" + "=" * 60)
-    print("⚡ PERFORMANCE COMPARISON")
-    print("=" * 60)
+class _Lazy:
+    """Memoized suspension: the thunk runs at most once"""
     
-    # Create different queue implementations
-    queues = [
-        ("ListQueue", ListQueue()),
-        ("ReverseListQueue", ReverseListQueue()),
-        ("TwoStackQueue", TwoStackQueue()),
-        ("CircularQueue", CircularQueue(1000)),  # Large capacity
-        ("collections.deque", collections_deque())
-    ]
+    __slots__ = ('_thunk', '_value')
     
-    # Performance test parameters
-    num_operations = 1000
+    def __init__(self, thunk=None, value=None):
+        self._thunk = thunk
+        self._value = value
     
-    print(f"\nPerformance test with {num_operations} operations each:")
-    print(f"{'Queue Type':<20} {'Enqueue Time':<15} {'Dequeue Time':<15} {'Total Time':<12}")
-    print("-" * 65)
+    def force(self):
+        if self._thunk is not None:
+            self._value = self._thunk()
+            self._thunk = None
+        return self._value
+
+
+def _lazy_append_reversed(front, rear):
+    """Lazy stream front ++ reverse(rear), where rear is a cons list
+    
+    Streams are None or (item, _Lazy tail). Only the cells that are actually
+    forced get built, and each is built once no matter how many versions
+    share it - the memoization that keeps the banker's queue amortized O(1)
+    even when old versions are reused.
+    """
+    def thunk():
+        cell = front.force()
+        if cell is None:
+            stream = None
+            node = rear
+            while node is not None:
+                stream = (node[0], _Lazy(value=stream))
+                node = node[1]
+            return stream
+        return (cell[0], _lazy_append_reversed(cell[1], rear))
+    return _Lazy(thunk)
+
+
+class PersistentStack:
+    """Immutable cons-list stack: push/pop return new versions in O(1)
+    
+    Every version shares its tail with the version it came from, so keeping
+    a snapshot is just keeping a reference and n retained versions cost only
+    the nodes they added. Versions derived from one another share a stats dict.
+    """
+    
+    __slots__ = ('_node', '_size', '_stats')
+    
+    def __init__(self, items=()):
+        """Build a stack from items (last item ends up on top)"""
+        node = None
+        size = 0
+        for item in items:
+            node = (item, node)
+            size += 1
+        self._node = node
+        self._size = size
+        self._stats = {'push_count': 0, 'pop_count': 0, 'versions': 1}
+    
+    def _derive(self, node, size):
+        version = PersistentStack.__new__(PersistentStack)
+        version._node = node
+        version._size = size
+        version._stats = self._stats
+        self._stats['versions'] += 1
+        return version
     
-    results = []
+    def push(self, item):
+        """Return a new stack with item on top (O(1))"""
+        self._stats['push_count'] += 1
+        return self._derive((item, self._node), self._size + 1)
     
-    for name, queue in queues:
-        # Test enqueue performance
-        start_time = time.time()
-        for i in range(num_operations):
-            if name == "CircularQueue" and hasattr(queue, 'is_full') and queue.is_full():
-                break
-            if hasattr(queue, 'enqueue'):
-                queue.enqueue(f"item_{i}")
-            else:  # collections.deque
-                queue.append(f"item_{i}")
-        enqueue_time = time.time() - start_time
-        
-        # Test dequeue performance
-        start_time = time.time()
-        dequeued_count = 0
-        while dequeued_count < num_operations:
-            try:
-                if hasattr(queue, 'dequeue'):
-                    queue.dequeue()
-                else:  # collections.deque
-                    queue.popleft()
-                dequeued_count += 1
-            except (IndexError, OverflowError):
-                break
-        dequeue_time = time.time() - start_time
+    def pop(self):
+        """Return (top item, stack without it) (O(1))"""
+        if self._node is None:
+            raise IndexError("pop from empty stack")
         
-        total_time = enqueue_time + dequeue_time
+        self._stats['pop_count'] += 1
+        item, rest = self._node
+        return item, self._derive(rest, self._size - 1)
+    
+    def peek(self):
+        """Peek at top item"""
+        if self._node is None:
+            raise IndexError("peek at empty stack")
+        return self._node[0]
+    
+    def is_empty(self):
+        return self._node is None
+    
+    def size(self):
+        return self._size
+    
+    def get_stats(self):
+        """Return statistics shared by this version's lineage"""
+        return {
+            'type': 'PersistentStack',
+            'size': self._size,
+            'operations': self._stats.copy(),
+            'efficiency': 'O(1) push/pop/snapshot, structural sharing'
+        }
+    
+    def __iter__(self):
+        """Iterate from top to bottom"""
+        node = self._node
+        while node is not None:
+            yield node[0]
+            node = node[1]
+    
+    def __len__(self):
+        return self._size
+    
+    def __str__(self):
+        if self._node is None:
+            return "PersistentStack(empty)"
+        return f"PersistentStack(top={self._node[0]}, size={self._size})"
+
+
+class PersistentQueue:
+    """Immutable banker's queue: enqueue/dequeue return new versions
+    
+    Items are split between a lazy front stream and a reversed rear cons
+    list. Whenever the rear grows longer than the front it is lazily appended
+    to the front, which gives amortized O(1) operations even when old
+    versions are used again (Okasaki's banker's queue).
+    """
+    
+    __slots__ = ('_front', '_front_size', '_rear', '_rear_size', '_stats')
+    
+    def __init__(self, items=()):
+        """Build a queue from items (first item ends up at the front)"""
+        self._front = _Lazy(value=None)
+        self._front_size = 0
+        self._rear = None
+        self._rear_size = 0
+        self._stats = {'enqueue_count': 0, 'dequeue_count': 0,
+                       'rotation_count': 0, 'versions': 1}
+        rear = None
+        for item in items:
+            rear = (item, rear)
+            self._rear_size += 1
+        if rear is not None:
+            self._front = _lazy_append_reversed(self._front, rear)
+            self._front_size = self._rear_size
+            self._rear_size = 0
+    
+    def _derive(self, front, front_size, rear, rear_size):
+        """Build a new version, rotating if the rear outgrew the front"""
+        if rear_size > front_size:
+            front = _lazy_append_reversed(front, rear)
+            front_size += rear_size
+            rear = None
+            rear_size = 0
+            self._stats['rotation_count'] += 1
         
-        print(f"{name:<20} {enqueue_time:.6f}s      {dequeue_time:.6f}s      {total_time:.6f}s")
+        version = PersistentQueue.__new__(PersistentQueue)
+        version._front = front
+        version._front_size = front_size
+        version._rear = rear
+        version._rear_size = rear_size
+        version._stats = self._stats
+        self._stats['versions'] += 1
+        return version
+    
+    def enqueue(self, item):
+        """Return a new queue with item at the rear (O(1) amortized)"""
+        self._stats['enqueue_count'] += 1
+        return self._derive(self._front, self._front_size,
+                            (item, self._rear), self._rear_size + 1)
+    
+    def dequeue(self):
+        """Return (front item, queue without it) (O(1) amortized)"""
+        cell = self._front.force()
+        if cell is None:
+            raise IndexError("dequeue from empty queue")
         
-        results.append((name, enqueue_time, dequeue_time, total_time))
+        self._stats['dequeue_count'] += 1
+        return cell[0], self._derive(cell[1], self._front_size - 1,
+                                     self._rear, self._rear_size)
     
-    # Show efficiency analysis
-    print(f"\n📊 Efficiency Analysis:")
-    fastest = min(results, key=lambda x: x[3])
-    slowest = max(results, key=lambda x: x[3])
+    def front(self):
+        """Peek at front item"""
+        cell = self._front.force()
+        if cell is None:
+            raise IndexError("front of empty queue")
+        return cell[0]
+    
+    def is_empty(self):
+        return self._front_size == 0
+    
+    def size(self):
+        return self._front_size + self._rear_size
+    
+    def get_stats(self):
+        """Return statistics shared by this version's lineage"""
+        return {
+            'type': 'PersistentQueue',
+            'size': self.size(),
+            'front_size': self._front_size,
+            'rear_size': self._rear_size,
+            'operations': self._stats.copy(),
+            'efficiency': 'Amortized O(1) enqueue/dequeue, O(1) snapshot'
+        }
+    
+    def __iter__(self):
+        """Iterate from front to rear"""
+        stream = self._front
+        cell = stream.force()
+        while cell is not None:
+            yield cell[0]
+            cell = cell[1].force()
+        rear_items = []
+        node = self._rear
+        while node is not None:
+            rear_items.append(node[0])
+            node = node[1]
+        yield from reversed(rear_items)
+    
+    def __len__(self):
+        return self.size()
+    
+    def __str__(self):
+        return f"PersistentQueue({list(self)})"
+
+
+# ============================================================================
+# PERFORMANCE COMPARISON
+# ============================================================================
+
+def performance_comparison():
+    """Compare queue implementations with the benchmark suite"""
+    # Imported here so the suite's banner only prints when it is used
+    from container_benchmarks import BenchmarkSuite, format_result, method_pair
+    
+    print("\n" + "=" * 60)
+    print("⚡ PERFORMANCE COMPARISON")
+    print("=" * 60)
+    
+    # Pass this module's classes in, so running it as a script benchmarks
+    # the same classes the rest of the demo uses
+    queue_pair = method_pair('enqueue', 'dequeue')
+    registry = {
+        'ListQueue': (lambda size: ListQueue(), queue_pair),
+        'ReverseListQueue': (lambda size: ReverseListQueue(), queue_pair),
+        'TwoStackQueue': (lambda size: TwoStackQueue(), queue_pair),
+        'CircularQueue': (lambda size: CircularQueue(2 * size + 1), queue_pair),
+        'Deque': (lambda size: Deque(), method_pair('add_rear', 'remove_front')),
+        'collections.deque': (lambda size: collections_deque(),
+                              method_pair('append', 'popleft')),
+    }
+    suite = BenchmarkSuite(
+        workloads=["fill_drain", "mixed_50_50"],
+        sizes=[1000],
+        repeats=9,
+        warmup=1,
+        registry=registry
+    )
+    
+    print(f"\nMedian of {suite.repeats} runs after {suite.warmup} warm-up run(s):")
+    print(f"{'Queue Type':<22} {'Workload':<14} {'Size':>7} {'Median per op':>16}  95% CI of run time")
+    print("-" * 90)
+    report = suite.run(progress=lambda result: print(format_result(result)))
     
-    print(f"  Fastest: {fastest[0]} ({fastest[3]:.6f}s)")
-    print(f"  Slowest: {slowest[0]} ({slowest[3]:.6f}s)")
-    print(f"  Speed difference: {slowest[3]/fastest[3]:.1f}x")
+    # Show efficiency analysis
+    print(f"\n📊 Efficiency Analysis (fill_drain):")
+    results = [r for r in report['results'] if r['workload'] == "fill_drain"]
+    fastest = min(results, key=lambda r: r['ns_per_op'])
+    slowest = max(results, key=lambda r: r['ns_per_op'])
+    
+    print(f"  Fastest: {fastest['container']} ({fastest['ns_per_op']:.1f} ns/op)")
+    print(f"  Slowest: {slowest['container']} ({slowest['ns_per_op']:.1f} ns/op)")
+    print(f"  Speed difference: {slowest['ns_per_op']/fastest['ns_per_op']:.1f}x")
+    print(f"  Full suite: python container_benchmarks.py --help")
+
+
+def priority_queue_comparison(num_operations=5000):
+    """Compare PriorityQueue with keeping a ListQueue sorted"""
+    print(f"\n🏆 Priority Queue vs Sorted ListQueue ({num_operations} items):")
+    
+    priorities = [(i * 7919) % num_operations for i in range(num_operations)]
+    
+    # Sorted-list approach: re-sort after every enqueue, dequeue with pop(0)
+    start_time = time.perf_counter()
+    sorted_queue = ListQueue()
+    for priority in priorities:
+        sorted_queue.enqueue((priority, f"job_{priority}"))
+        sorted_queue._items.sort()
+    while not sorted_queue.is_empty():
+        sorted_queue.dequeue()
+    sorted_time = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    heap_queue = PriorityQueue()
+    for priority in priorities:
+        heap_queue.enqueue(f"job_{priority}", priority)
+    while not heap_queue.is_empty():
+        heap_queue.dequeue()
+    heap_time = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    bulk_queue = PriorityQueue((f"job_{p}", p) for p in priorities)
+    while not bulk_queue.is_empty():
+        bulk_queue.dequeue()
+    bulk_time = time.perf_counter() - start_time
+    
+    print(f"    ListQueue + sort:          {sorted_time:.6f}s")
+    print(f"    PriorityQueue (enqueue):   {heap_time:.6f}s")
+    print(f"    PriorityQueue (bulk init): {bulk_time:.6f}s")
+    print(f"    Heap speedup: {sorted_time/heap_time:.1f}x")
+
+
+def instrumentation_overhead_comparison(num_operations=100000, repeats=5):
+    """Measure what operation counting costs when it is on and off"""
+    print(f"\n🔬 Instrumentation Overhead ({num_operations} push+pop, best of {repeats}):")
+    
+    def best_time(push, pop):
+        best = float('inf')
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            for i in range(num_operations):
+                push(i)
+            for _ in range(num_operations):
+                pop()
+            best = min(best, time.perf_counter() - start_time)
+        return best
+    
+    plain_list = []
+    baseline = best_time(plain_list.append, plain_list.pop)
+    print(f"    {'list append/pop':<32} {baseline:.6f}s  (baseline)")
+    
+    candidates = [
+        ("MonitoredStack (disabled)", MonitoredStack(instrumented=False), 'push', 'pop'),
+        ("MonitoredStack (enabled)", MonitoredStack(), 'push', 'pop'),
+        ("CircularQueue (disabled)", CircularQueue(num_operations, instrumented=False),
+         'enqueue', 'dequeue'),
+        ("CircularQueue (enabled)", CircularQueue(num_operations), 'enqueue', 'dequeue'),
+    ]
+    for name, container, push_name, pop_name in candidates:
+        elapsed = best_time(getattr(container, push_name), getattr(container, pop_name))
+        print(f"    {name:<32} {elapsed:.6f}s  ({elapsed/baseline:.1f}x list)")
+    
+    # Instrumentation can also be switched at runtime
+    stack = MonitoredStack()
+    stack.push("counted")
+    stack.set_instrumented(False)
+    stack.push("not counted")
+    stack.set_instrumented(True)
+    print(f"    Runtime toggle: push_count={stack.get_stats()['operations']['push_count']} "
+          f"for size={stack.size()}")
 
 
 def demonstrate_queue_implementations():
@@ -630,11 +1854,84 @@ def demonstrate_deque_functionality():
     
     print(f"    Front: {dq.front()}, Rear: {dq.rear()}")
     
+    # Indexing, slicing and rotation
+    print(f"\n  Indexing, slicing and rotation:")
+    print(f"    dq[1]: {dq[1]}, dq[-1]: {dq[-1]}")
+    print(f"    dq[1:4]: {dq[1:4]}")
+    dq.rotate(2)
+    print(f"    After rotate(2): {dq}")
+    dq.rotate(-2)
+    print(f"    After rotate(-2): {dq}")
+    
+    # Indexed mode for O(1) membership
+    seen = Deque(indexed=True)
+    for item in ["a", "b", "a", "c"]:
+        if item not in seen:
+            seen.add_rear(item)
+    print(f"\n  Indexed dedupe: {seen}, count('a'): {seen.count('a')}")
+    print(f"    Index entries: {seen.get_stats()['index_entries']}")
+    
     # Show statistics
     stats = dq.get_stats()
     print(f"    Operation stats: {stats['operations']}")
 
 
+def demonstrate_priority_queue():
+    """Show priority ordering, FIFO tie-breaks and fused operations"""
+    print(f"\n🏆 Priority Queue:")
+    
+    pq = PriorityQueue([("backup", 3), ("deploy", 1), ("email", 2)])
+    pq.enqueue("hotfix", 1)  # Same priority as deploy - comes after it
+    print(f"    Built from iterable: {pq}")
+    
+    print(f"    push_pop('lint', 0): {pq.push_pop('lint', 0)}")
+    print(f"    replace('report', 5): {pq.replace('report', 5)}")
+    print(f"    After fused operations: {pq}")
+    
+    order = []
+    while not pq.is_empty():
+        order.append(pq.dequeue())
+    print(f"    Dequeue order: {order}")
+    print(f"    Stats: {pq.get_stats()}")
+
+
+def demonstrate_indexed_priority_queue():
+    """Show rescheduling, cancelling and decrease-key in graph search"""
+    print(f"\n🗂️ Indexed Priority Queue:")
+    
+    scheduler = IndexedPriorityQueue()
+    handles = {name: scheduler.enqueue(name, due)
+               for name, due in [("report", 30), ("backup", 10), ("cleanup", 20)]}
+    print(f"    Scheduled: {scheduler}")
+    
+    scheduler.update_priority(handles["report"], 5)   # Reschedule earlier
+    scheduler.remove(handles["cleanup"])              # Cancel
+    print(f"    After reschedule/cancel: {scheduler}")
+    
+    # Dijkstra's shortest paths with decrease-key
+    graph = {
+        'A': {'B': 4, 'C': 1},
+        'C': {'B': 2, 'D': 5},
+        'B': {'D': 1},
+        'D': {}
+    }
+    distances = {'A': 0}
+    frontier = IndexedPriorityQueue()
+    handle_of = {'A': frontier.enqueue('A', 0)}
+    while not frontier.is_empty():
+        node = frontier.dequeue()
+        for neighbor, weight in graph[node].items():
+            candidate = distances[node] + weight
+            if candidate < distances.get(neighbor, float('inf')):
+                distances[neighbor] = candidate
+                if handle_of.get(neighbor) in frontier:
+                    frontier.update_priority(handle_of[neighbor], candidate)
+                else:
+                    handle_of[neighbor] = frontier.enqueue(neighbor, candidate)
+    print(f"    Shortest distances from A: {distances}")
+    print(f"    Stats: {frontier.get_stats()}")
+
+
 def demonstrate_stack_monitoring():
     """Show monitored stack capabilities"""
     print(f"\n📊 Stack Monitoring:")
@@ -675,6 +1972,70 @@ def demonstrate_stack_monitoring():
         print(f"      {key}: {value}")
 
 
+def demonstrate_min_max_stack():
+    """Show O(1) min/max tracking through pushes and pops"""
+    print(f"\n📉 Min/Max Stack:")
+    
+    stack = MinMaxStack()
+    for value in [5, 3, 8, 3, 9, 1]:
+        stack.push(value)
+        print(f"    Pushed {value}: {stack}")
+    
+    while stack.size() > 2:
+        value = stack.pop()
+        print(f"    Popped {value}: {stack}")
+    
+    stats = stack.get_stats()
+    print(f"    Aux entries: min={stats['min_entries']}, max={stats['max_entries']}")
+
+
+def demonstrate_persistent_containers():
+    """Show O(1) snapshots through structural sharing"""
+    print(f"\n🧊 Persistent Containers:")
+    
+    audit_log = []
+    queue = PersistentQueue()
+    for job in ["A", "B", "C"]:
+        queue = queue.enqueue(job)
+        audit_log.append(queue)  # Snapshot is just a reference
+    
+    item, queue = queue.dequeue()
+    print(f"    Dequeued {item}, current: {queue}")
+    print(f"    Snapshots: {[str(version) for version in audit_log]}")
+    
+    base = PersistentStack(["x", "y"])
+    left = base.push("left")
+    right = base.push("right")
+    print(f"    Branches share {base}: {list(left)} and {list(right)}")
+    print(f"    Queue stats: {queue.get_stats()['operations']}")
+
+
+def demonstrate_latency_histograms():
+    """Show tail latency that operation counts alone hide"""
+    print(f"\n⏱️ Latency Histograms:")
+    
+    for queue in [ListQueue(), TwoStackQueue()]:
+        queue.enable_latency_tracking(sample_every=1)
+        for i in range(20000):
+            queue.enqueue(i)
+        while not queue.is_empty():
+            queue.dequeue()
+        latency = queue.get_stats()['latency']['dequeue']
+        print(f"    {type(queue).__name__:<14} dequeue p50={latency['p50_ns']}ns "
+              f"p99={latency['p99_ns']}ns max={latency['max_ns']}ns")
+    
+    # Histograms from separate instances merge into one view
+    merged = LatencyHistogram()
+    for _ in range(3):
+        queue = CircularQueue(100)
+        queue.enable_latency_tracking(sample_every=4)
+        for i in range(1000):
+            queue.enqueue(i)
+            queue.dequeue()
+        merged.merge(queue.disable_latency_tracking()['enqueue'])
+    print(f"    Merged CircularQueue enqueue (1 in 4 sampled): {merged.summary()}")
+
+
 # ============================================================================
 # MAIN DEMONSTRATION FUNCTION
 # ============================================================================
@@ -686,8 +2047,15 @@ def main():
     
     demonstrate_queue_implementations()
     demonstrate_deque_functionality()
+    demonstrate_priority_queue()
+    demonstrate_indexed_priority_queue()
     demonstrate_stack_monitoring()
+    demonstrate_min_max_stack()
+    demonstrate_persistent_containers()
+    demonstrate_latency_histograms()
     performance_comparison()
+    priority_queue_comparison()
+    instrumentation_overhead_comparison()
     
     print(f"\n" + "=" * 60)
     print("✅ All container ADT demonstrations complete!")
@@ -704,6 +2072,8 @@ def main():
     print(f"   • ListQueue: Simple but inefficient dequeue")
     print(f"   • TwoStackQueue: Complex but amortized efficiency")
     print(f"   • CircularQueue: Best performance with fixed size")
+    print(f"   • Deque: Block-linked storage, O(1) at both ends")
+    print(f"   • PriorityQueue: O(log n) heap beats re-sorting a list")
     print(f"   • collections.deque: Built-in optimized solution")
 
 
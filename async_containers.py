@@ -0,0 +1,259 @@
+"""
+Async Container ADTs - Week 3
+CSC 242 - Object-Oriented Programming
+
+This file demonstrates awaitable queues built on the container ADTs:
+- Backpressure: put() waits while the queue is full
+- Blocking consumers: get() waits while the queue is empty
+- Batch draining with get_many(max_items, timeout)
+- Bounded memory using CircularQueue or Deque storage
+- Waiter counts reported through get_stats()
+
+Author: CSC 242 Teaching Team
+"""
+
+import asyncio
+from collections import deque as collections_deque
+
+from advanced_containers import CircularQueue, Deque
+
+
+# ============================================================================
+# ASYNC QUEUE BASE
+# ============================================================================
+
+print("⏳ ASYNC CONTAINER ADTs")
+print("=" * 60)
+
+class AsyncQueue:
+    """Awaitable FIFO queue with backpressure over an existing queue ADT"""
+
+    def __init__(self, backend, maxsize=None):
+        """Wrap a queue ADT exposing enqueue/dequeue/front/size/is_empty"""
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("maxsize must be positive or None")
+
+        self._backend = backend
+        self._maxsize = maxsize
+        self._getters = collections_deque()  # Futures of waiting consumers
+        self._putters = collections_deque()  # Futures of waiting producers
+        self._put_waits = 0
+        self._get_waits = 0
+        self._batch_gets = 0
+        self._timeouts = 0
+
+    def _wakeup_next(self, waiters, count=1):
+        """Wake up to count waiters that are still pending"""
+        while waiters and count > 0:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+    async def _wait(self, waiters, still_blocked):
+        """Park the current task until still_blocked() turns false"""
+        while still_blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # Pass our wakeup on so it is not lost with the cancelled task
+                if not still_blocked() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    def is_full(self):
+        """Check if a put() would have to wait"""
+        if self._maxsize is not None and self._backend.size() >= self._maxsize:
+            return True
+        backend_full = getattr(self._backend, 'is_full', None)
+        return bool(backend_full and backend_full())
+
+    def is_empty(self):
+        return self._backend.is_empty()
+
+    def size(self):
+        return self._backend.size()
+
+    def put_nowait(self, item):
+        """Add item to rear or raise OverflowError if full"""
+        if self.is_full():
+            raise OverflowError("put to full async queue")
+
+        self._backend.enqueue(item)
+        self._wakeup_next(self._getters)
+
+    def get_nowait(self):
+        """Remove item from front or raise IndexError if empty"""
+        if self._backend.is_empty():
+            raise IndexError("get from empty async queue")
+
+        item = self._backend.dequeue()
+        self._wakeup_next(self._putters)
+        return item
+
+    async def put(self, item):
+        """Add item to rear, waiting while the queue is full"""
+        if self.is_full():
+            self._put_waits += 1
+            await self._wait(self._putters, self.is_full)
+        self.put_nowait(item)
+
+    async def get(self):
+        """Remove and return front item, waiting while the queue is empty"""
+        if self.is_empty():
+            self._get_waits += 1
+            await self._wait(self._getters, self.is_empty)
+        return self.get_nowait()
+
+    async def get_many(self, max_items, timeout=None):
+        """Wait up to timeout for at least one item, then drain up to max_items
+
+        Returns an empty list if the timeout expires with nothing queued.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+
+        if self.is_empty():
+            self._get_waits += 1
+            try:
+                await asyncio.wait_for(self._wait(self._getters, self.is_empty), timeout)
+            except asyncio.TimeoutError:
+                self._timeouts += 1
+                return []
+
+        batch = []
+        while len(batch) < max_items and not self._backend.is_empty():
+            batch.append(self._backend.dequeue())
+
+        self._batch_gets += 1
+        self._wakeup_next(self._putters, len(batch))
+        return batch
+
+    def get_stats(self):
+        """Return backend statistics plus waiter counts"""
+        stats = self._backend.get_stats()
+        stats.update({
+            'type': type(self).__name__,
+            'backend': stats.get('type'),
+            'maxsize': self._maxsize,
+            'waiting_putters': sum(1 for w in self._putters if not w.done()),
+            'waiting_getters': sum(1 for w in self._getters if not w.done()),
+            'put_waits': self._put_waits,
+            'get_waits': self._get_waits,
+            'batch_gets': self._batch_gets,
+            'timeouts': self._timeouts
+        })
+        return stats
+
+    def __len__(self):
+        return self._backend.size()
+
+    def __str__(self):
+        return f"{type(self).__name__}(size={self.size()}, maxsize={self._maxsize})"
+
+
+# ============================================================================
+# CONCRETE ASYNC QUEUES
+# ============================================================================
+
+class AsyncCircularQueue(AsyncQueue):
+    """Async queue on a fixed-capacity circular buffer"""
+
+    def __init__(self, capacity):
+        """Initialize with fixed capacity (the backpressure limit)"""
+        super().__init__(CircularQueue(capacity), maxsize=capacity)
+
+    def capacity(self):
+        return self._backend.capacity()
+
+
+class AsyncDeque(AsyncQueue):
+    """Async queue on a Deque with an optional size limit"""
+
+    def __init__(self, maxsize=None):
+        """Initialize with optional maxsize (None means unbounded)"""
+        super().__init__(Deque(), maxsize=maxsize)
+
+
+# ============================================================================
+# DEMONSTRATION FUNCTIONS
+# ============================================================================
+
+def demonstrate_backpressure():
+    """Show a fast producer being throttled by a slow consumer"""
+    print(f"\n🚦 Backpressure with AsyncCircularQueue:")
+
+    async def run():
+        queue = AsyncCircularQueue(3)
+
+        async def producer():
+            for i in range(8):
+                await queue.put(f"job_{i}")
+            await queue.put(None)  # Sentinel
+
+        async def consumer():
+            received = []
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return received
+                received.append(item)
+                await asyncio.sleep(0.001)
+
+        producer_task = asyncio.create_task(producer())
+        received = await consumer()
+        await producer_task
+        return received, queue.get_stats()
+
+    received, stats = asyncio.run(run())
+    print(f"    Received: {received}")
+    print(f"    Producer waits: {stats['put_waits']}, consumer waits: {stats['get_waits']}")
+
+
+def demonstrate_batch_draining():
+    """Show get_many collecting batches with a timeout"""
+    print(f"\n📥 Batch draining with AsyncDeque.get_many:")
+
+    async def run():
+        queue = AsyncDeque(maxsize=100)
+        for i in range(7):
+            await queue.put(i)
+
+        batches = [await queue.get_many(3, timeout=0.01) for _ in range(4)]
+        return batches, queue.get_stats()
+
+    batches, stats = asyncio.run(run())
+    print(f"    Batches: {batches}")
+    print(f"    Batch gets: {stats['batch_gets']}, timeouts: {stats['timeouts']}")
+
+
+# ============================================================================
+# MAIN DEMONSTRATION FUNCTION
+# ============================================================================
+
+def main():
+    """Run all async container demonstrations"""
+    print("⏳ ASYNC CONTAINER ADTs - CSC 242 Week 3")
+    print("=" * 60)
+
+    demonstrate_backpressure()
+    demonstrate_batch_draining()
+
+    print(f"\n" + "=" * 60)
+    print("✅ All async container demonstrations complete!")
+
+    print(f"\n💡 Key Async Queue Concepts:")
+    print(f"   1. Bounded queues push back on fast producers")
+    print(f"   2. Waiting tasks park on futures instead of spinning")
+    print(f"   3. Batch draining amortizes per-item scheduling cost")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""
+Container Benchmarks - Week 3
+CSC 242 - Object-Oriented Programming
+
+This file is a repeatable benchmark suite for the container ADTs:
+- Every container, several sizes, mixed add/remove ratios
+- Warm-up runs before anything is measured
+- perf_counter_ns timing with repeated runs, medians and confidence intervals
+- Machine-readable JSON results
+- Comparison against a stored baseline that fails on regressions
+
+Confidence intervals for the median need at least CI_MIN_SAMPLES (9)
+repeats; with fewer, results carry no interval and baseline comparisons
+use the median ratio alone.
+
+Usage:
+    python container_benchmarks.py --sizes 1000 10000 --output results.json
+    python container_benchmarks.py --baseline results.json --threshold 0.10
+
+Author: CSC 242 Teaching Team
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+from collections import deque as collections_deque
+
+
+# ============================================================================
+# CONTAINER ADAPTERS
+# ============================================================================
+
+print("🏁 CONTAINER BENCHMARK SUITE")
+print("=" * 60)
+
+def method_pair(add_name, remove_name):
+    """Adapter for containers with one-argument add and no-argument remove"""
+    def bind(container):
+        return getattr(container, add_name), getattr(container, remove_name)
+    return bind
+
+
+def _priority_pair(container):
+    """Adapter for priority queues: each item is its own priority"""
+    enqueue = container.enqueue
+    return (lambda item: enqueue(item, item)), container.dequeue
+
+
+def _persistent_pair(add_name, remove_name):
+    """Adapter that threads the newest version through add/remove"""
+    def bind(container):
+        state = [container]
+
+        def add(item):
+            state[0] = getattr(state[0], add_name)(item)
+
+        def remove():
+            item, state[0] = getattr(state[0], remove_name)()
+            return item
+        return add, remove
+    return bind
+
+
+def default_containers():
+    """name -> (factory(size), adapter(container) -> (add, remove)) for every ADT
+    
+    The container modules are imported here, where the table is built, so
+    advanced_containers can import this module without a circular import.
+    Bounded containers get room for the prefill plus the largest burst of adds.
+    """
+    from advanced_containers import (
+        CircularQueue, Deque, IndexedPriorityQueue, ListQueue, MinMaxStack,
+        MonitoredStack, PersistentQueue, PersistentStack, PriorityQueue,
+        ReverseListQueue, TwoStackQueue
+    )
+    from custom_exceptions import SafeQueue, SafeStack
+    
+    return {
+        'ListQueue': (lambda size: ListQueue(), method_pair('enqueue', 'dequeue')),
+        'ReverseListQueue': (lambda size: ReverseListQueue(), method_pair('enqueue', 'dequeue')),
+        'TwoStackQueue': (lambda size: TwoStackQueue(), method_pair('enqueue', 'dequeue')),
+        'CircularQueue': (lambda size: CircularQueue(2 * size + 1), method_pair('enqueue', 'dequeue')),
+        'Deque': (lambda size: Deque(), method_pair('add_rear', 'remove_front')),
+        'PriorityQueue': (lambda size: PriorityQueue(), _priority_pair),
+        'IndexedPriorityQueue': (lambda size: IndexedPriorityQueue(), _priority_pair),
+        'MonitoredStack': (lambda size: MonitoredStack(), method_pair('push', 'pop')),
+        'MinMaxStack': (lambda size: MinMaxStack(), method_pair('push', 'pop')),
+        'PersistentQueue': (lambda size: PersistentQueue(), _persistent_pair('enqueue', 'dequeue')),
+        'PersistentStack': (lambda size: PersistentStack(), _persistent_pair('push', 'pop')),
+        'SafeQueue': (lambda size: SafeQueue(), method_pair('enqueue', 'dequeue')),
+        'SafeStack': (lambda size: SafeStack(), method_pair('push', 'pop')),
+        'collections.deque': (lambda size: collections_deque(), method_pair('append', 'popleft')),
+    }
+
+
+# ============================================================================
+# WORKLOADS
+# ============================================================================
+
+def _fill_drain_plan(size, seed):
+    """size adds followed by size removes, starting empty"""
+    return 0, [True] * size + [False] * size
+
+
+def _mixed_plan(add_ratio):
+    """Prefill size items, then size operations adding with add_ratio"""
+    def plan(size, seed):
+        rng = random.Random(seed)
+        return size, [rng.random() < add_ratio for _ in range(size)]
+    return plan
+
+
+# name -> plan(size, seed) -> (prefill_count, [True=add, False=remove])
+WORKLOADS = {
+    'fill_drain': _fill_drain_plan,
+    'mixed_50_50': _mixed_plan(0.5),
+    'mixed_90_add': _mixed_plan(0.9),
+    'mixed_10_add': _mixed_plan(0.1),
+}
+
+
+def _run_plan(add, remove, plan):
+    """Execute a plan of adds (True) and removes (False)"""
+    item = 0
+    for is_add in plan:
+        if is_add:
+            add(item)
+            item += 1
+        else:
+            remove()
+
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+# Fewest samples whose 95% median interval is narrower than (min, max)
+CI_MIN_SAMPLES = 9
+
+
+def median_confidence_interval(samples, confidence=0.95):
+    """Distribution-free confidence interval for the median, or None
+
+    Uses the order statistics x(j+1) and x(n-j) for the largest j with
+    P(Binomial(n, 1/2) <= j) <= (1 - confidence) / 2, which cover the
+    median with at least the given confidence whatever the shape of the
+    timing distribution. When only j = 0, i.e. (min, max), qualifies (fewer
+    than CI_MIN_SAMPLES samples at 95%) there is no useful interval and
+    None is returned.
+    """
+    ordered = sorted(samples)
+    n = len(ordered)
+    tail = (1 - confidence) / 2
+    j, cumulative = -1, 0.0
+    while j + 1 < n:
+        cumulative += math.comb(n, j + 1) / 2 ** n
+        if cumulative > tail:
+            break
+        j += 1
+    if j < 1:
+        return None
+    return ordered[j], ordered[n - 1 - j]
+
+
+# ============================================================================
+# BENCHMARK RUNNER
+# ============================================================================
+
+class BenchmarkSuite:
+    """Runs container x workload x size cases with warm-up and repeats"""
+
+    def __init__(self, containers=None, workloads=None, sizes=(100, 1000, 10000),
+                 repeats=11, warmup=2, seed=242, registry=None):
+        """Select cases (None means all) and measurement parameters
+        
+        registry maps names to (factory, adapter) pairs like
+        default_containers(), which is used when it is omitted. Use at least
+        CI_MIN_SAMPLES repeats to get confidence intervals.
+        """
+        if repeats < 1:
+            raise ValueError("repeats must be at least 1")
+        self.registry = default_containers() if registry is None else registry
+        unknown = set(containers or ()) - set(self.registry)
+        unknown |= set(workloads or ()) - set(WORKLOADS)
+        if unknown:
+            raise ValueError(f"Unknown containers/workloads: {sorted(unknown)}")
+
+        self.containers = list(containers or self.registry)
+        self.workloads = list(workloads or WORKLOADS)
+        self.sizes = list(sizes)
+        self.repeats = repeats
+        self.warmup = warmup
+        self.seed = seed
+
+    def _measure_once(self, container_name, plan, prefill):
+        """Time one run on a fresh, prefilled container (setup untimed)"""
+        factory, adapter = self.registry[container_name]
+        add, remove = adapter(factory(len(plan)))
+        for i in range(prefill):
+            add(-i)
+
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            _run_plan(add, remove, plan)
+            return time.perf_counter_ns() - start
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def run_case(self, container_name, workload_name, size):
+        """Warm up, then measure repeats runs of one case"""
+        prefill, plan = WORKLOADS[workload_name](size, self.seed)
+        for _ in range(self.warmup):
+            self._measure_once(container_name, plan, prefill)
+        samples = [self._measure_once(container_name, plan, prefill)
+                   for _ in range(self.repeats)]
+
+        median = statistics.median(samples)
+        ci_low, ci_high = median_confidence_interval(samples) or (None, None)
+        return {
+            'container': container_name,
+            'workload': workload_name,
+            'size': size,
+            'operations': len(plan),
+            'samples_ns': samples,
+            'median_ns': median,
+            'ci_low_ns': ci_low,
+            'ci_high_ns': ci_high,
+            'ns_per_op': median / len(plan)
+        }
+
+    def run(self, progress=None):
+        """Run every selected case and return a JSON-ready report"""
+        results = []
+        for size in self.sizes:
+            for workload_name in self.workloads:
+                for container_name in self.containers:
+                    result = self.run_case(container_name, workload_name, size)
+                    results.append(result)
+                    if progress:
+                        progress(result)
+        return {
+            'meta': {
+                'python': sys.version.split()[0],
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'timestamp': time.time(),
+                'repeats': self.repeats,
+                'warmup': self.warmup,
+                'seed': self.seed
+            },
+            'results': results
+        }
+
+
+def _case_key(result):
+    return (result['container'], result['workload'], result['size'])
+
+
+def compare_to_baseline(report, baseline, threshold=0.10):
+    """Return cases whose median slowed down by more than threshold
+
+    A case counts as a regression when the median ratio exceeds
+    1 + threshold. When both runs have confidence intervals (at least
+    CI_MIN_SAMPLES repeats each), the intervals must also not overlap, so
+    ordinary run-to-run noise does not fail the comparison.
+    """
+    previous = {_case_key(result): result for result in baseline['results']}
+    regressions = []
+    for result in report['results']:
+        old = previous.get(_case_key(result))
+        if old is None:
+            continue
+        ratio = result['median_ns'] / old['median_ns']
+        separated = (result['ci_low_ns'] is None or old.get('ci_high_ns') is None
+                     or result['ci_low_ns'] > old['ci_high_ns'])
+        if ratio > 1 + threshold and separated:
+            regressions.append({
+                'container': result['container'],
+                'workload': result['workload'],
+                'size': result['size'],
+                'baseline_median_ns': old['median_ns'],
+                'median_ns': result['median_ns'],
+                'ratio': ratio
+            })
+    return regressions
+
+
+def format_result(result):
+    """One-line human-readable summary of a case"""
+    if result['ci_low_ns'] is None:
+        interval = f"(no CI below {CI_MIN_SAMPLES} repeats)"
+    else:
+        interval = f"[{result['ci_low_ns']/1e6:.3f}, {result['ci_high_ns']/1e6:.3f}] ms"
+    return (f"{result['container']:<22} {result['workload']:<14} {result['size']:>7} "
+            f"{result['ns_per_op']:>10.1f} ns/op  {interval}")
+
+
+# ============================================================================
+# COMMAND LINE INTERFACE
+# ============================================================================
+
+def main(argv=None):
+    """Run the suite from the command line; exit status 1 on regressions"""
+    parser = argparse.ArgumentParser(description="Benchmark the container ADTs")
+    parser.add_argument('--containers', nargs='+', choices=sorted(default_containers()))
+    parser.add_argument('--workloads', nargs='+', choices=sorted(WORKLOADS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[100, 1000, 10000])
+    parser.add_argument('--repeats', type=int, default=11,
+                        help=f"timed runs per case (confidence intervals need "
+                             f"at least {CI_MIN_SAMPLES})")
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=242)
+    parser.add_argument('--output', help="write the JSON report here")
+    parser.add_argument('--baseline', help="JSON report to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed slowdown ratio before failing (default 0.10)")
+    args = parser.parse_args(argv)
+
+    suite = BenchmarkSuite(args.containers, args.workloads, args.sizes,
+                           args.repeats, args.warmup, args.seed)
+    print(f"\n{'Container':<22} {'Workload':<14} {'Size':>7} {'Median per op':>16}  95% CI of run time")
+    print("-" * 90)
+    report = suite.run(progress=lambda result: print(format_result(result)))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) above {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"   {regression['container']} {regression['workload']} "
+                      f"size={regression['size']}: {regression['ratio']:.2f}x slower")
+            return 1
+        print(f"\n✅ No regressions above {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
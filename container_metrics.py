@@ -0,0 +1,312 @@
+"""
+Container Metrics - Week 3
+CSC 242 - Object-Oriented Programming
+
+This file demonstrates a process-wide view of container statistics:
+- Weak registration, so the registry never keeps a container alive
+- Automatic registration of every container as it is created
+- Periodic scraping of get_stats() on a background thread
+- Per-type totals aggregated across all live containers
+- Prometheus text exposition format output
+- JSON lines output for offline analysis
+
+Author: CSC 242 Teaching Team
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+
+import advanced_containers
+from advanced_containers import CircularQueue, Deque, ListQueue, MonitoredStack
+
+
+# ============================================================================
+# METRICS REGISTRY
+# ============================================================================
+
+print("📈 CONTAINER METRICS REGISTRY")
+print("=" * 60)
+
+class MetricsRegistry:
+    """Weak registry of live containers that scrapes their get_stats()
+    
+    Scraping only calls get_stats(), which is O(1) for every container in
+    advanced_containers.py: no container lock is taken and no contents are
+    walked. The registry's own lock guards only its table of weak references.
+    """
+    
+    def __init__(self, interval=10.0, prometheus_path=None, jsonl_path=None):
+        """Configure scrape interval (seconds) and optional output files"""
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        
+        self._interval = interval
+        self._prometheus_path = prometheus_path
+        self._jsonl_path = jsonl_path
+        self._containers = weakref.WeakValueDictionary()  # label -> container
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._scrape_count = 0
+        self._scrape_errors = 0
+    
+    # Registration --------------------------------------------------------
+    
+    def register(self, container, label=None):
+        """Track container weakly under label (generated if omitted)"""
+        with self._lock:
+            self._next_id += 1
+            if label is None:
+                label = f"{type(container).__name__}_{self._next_id}"
+            self._containers[label] = container
+        return label
+    
+    def watch_new_containers(self):
+        """Register every container created from now on"""
+        advanced_containers.add_creation_hook(self.register)
+    
+    def stop_watching(self):
+        """Stop registering newly created containers"""
+        advanced_containers.remove_creation_hook(self.register)
+    
+    def live_count(self):
+        with self._lock:
+            return len(self._containers)
+    
+    # Scraping ------------------------------------------------------------
+    
+    def scrape(self):
+        """Return [(label, stats)] for every live container"""
+        with self._lock:
+            containers = list(self._containers.items())
+        
+        samples = []
+        errors = 0
+        for label, container in containers:
+            try:
+                samples.append((label, container.get_stats()))
+            except Exception:
+                errors += 1  # One broken container must not stop the scrape
+        with self._lock:
+            self._scrape_count += 1
+            self._scrape_errors += errors
+        return samples
+    
+    def aggregate(self, samples):
+        """Sum every numeric stat per container type
+        
+        Returns {type: {'instances': n, name: total, ...}} with nested stats
+        flattened the same way as the Prometheus output.
+        """
+        totals = {}
+        for label, stats in samples:
+            type_totals = totals.setdefault(stats.get('type', 'unknown'), {'instances': 0})
+            type_totals['instances'] += 1
+            for name, value in self._flatten(stats):
+                type_totals[name] = type_totals.get(name, 0) + value
+        return totals
+    
+    @staticmethod
+    def _flatten(stats, prefix=""):
+        """Yield (name, number) for numeric values, flattening nested dicts"""
+        for key, value in stats.items():
+            name = f"{prefix}{key}"
+            if isinstance(value, dict):
+                yield from MetricsRegistry._flatten(value, f"{name}_")
+            elif isinstance(value, bool):
+                yield name, int(value)
+            elif isinstance(value, (int, float)):
+                yield name, value
+    
+    @staticmethod
+    def _escape_label(value):
+        """Escape a label value for the Prometheus text format"""
+        return (str(value).replace("\\", "\\\\").replace('"', '\\"')
+                .replace("\n", "\\n"))
+    
+    def to_prometheus(self, samples):
+        """Render samples, and per-type totals, in Prometheus text exposition format"""
+        escape = self._escape_label
+        metrics = {}
+        for label, stats in samples:
+            labels = (f'container="{escape(label)}",'
+                      f'type="{escape(stats.get("type", "unknown"))}"')
+            for name, value in self._flatten(stats):
+                metrics.setdefault(f"container_{name}", []).append((labels, value))
+        for type_name, totals in self.aggregate(samples).items():
+            labels = f'type="{escape(type_name)}"'
+            for name, value in totals.items():
+                metrics.setdefault(f"container_type_{name}", []).append((labels, value))
+        
+        lines = []
+        for metric in sorted(metrics):
+            kind = "counter" if metric.endswith("_count") else "gauge"
+            lines.append(f"# TYPE {metric} {kind}")
+            for labels, value in metrics[metric]:
+                lines.append(f"{metric}{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+    
+    def to_json_lines(self, samples, timestamp=None):
+        """Render samples as one JSON object per container, then one per type"""
+        timestamp = time.time() if timestamp is None else timestamp
+        lines = [json.dumps({'timestamp': timestamp, 'container': label, 'stats': stats},
+                            default=str) + "\n"
+                 for label, stats in samples]
+        lines.extend(json.dumps({'timestamp': timestamp, 'type': type_name,
+                                 'totals': totals}) + "\n"
+                     for type_name, totals in self.aggregate(samples).items())
+        return "".join(lines)
+    
+    def collect(self):
+        """Scrape once and write the configured outputs"""
+        samples = self.scrape()
+        if self._prometheus_path:
+            # Write then rename so readers never see a half-written file
+            temp_path = f"{self._prometheus_path}.tmp"
+            with open(temp_path, "w") as f:
+                f.write(self.to_prometheus(samples))
+            os.replace(temp_path, self._prometheus_path)
+        if self._jsonl_path:
+            with open(self._jsonl_path, "a") as f:
+                f.write(self.to_json_lines(samples))
+        return samples
+    
+    # Background thread ---------------------------------------------------
+    
+    def start(self):
+        """Start collecting every interval seconds on a daemon thread"""
+        if self._thread is not None:
+            raise RuntimeError("registry is already running")
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-registry",
+                                        daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the background thread after one final collection"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.collect()
+    
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            self.collect()
+    
+    def get_stats(self):
+        """Return the registry's own statistics"""
+        with self._lock:
+            scrape_count, scrape_errors = self._scrape_count, self._scrape_errors
+        return {
+            'type': 'MetricsRegistry',
+            'live_containers': self.live_count(),
+            'scrape_count': scrape_count,
+            'scrape_errors': scrape_errors,
+            'interval': self._interval,
+            'running': self._thread is not None
+        }
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+# ============================================================================
+# DEMONSTRATION FUNCTIONS
+# ============================================================================
+
+def demonstrate_registry():
+    """Scrape containers created while the registry is watching"""
+    print(f"\n📋 Registry Scraping:")
+    
+    registry = MetricsRegistry()
+    registry.watch_new_containers()
+    try:
+        queue = ListQueue()
+        ring = CircularQueue(4)
+        stack = MonitoredStack(max_size=10)
+        temporary = Deque()
+    finally:
+        registry.stop_watching()
+    
+    for i in range(3):
+        queue.enqueue(i)
+        ring.enqueue(i)
+        stack.push(i)
+    print(f"    Live containers: {registry.live_count()}")
+    
+    del temporary  # Weak registration: dropped containers disappear
+    print(f"    After deleting one: {registry.live_count()}")
+    
+    samples = registry.scrape()
+    exposition = registry.to_prometheus(samples)
+    print(f"    Prometheus sample:")
+    for line in exposition.splitlines():
+        if line.startswith("container_size") or line.startswith("# TYPE container_size "):
+            print(f"      {line}")
+    
+    print(f"    Per-type totals:")
+    for type_name, totals in sorted(registry.aggregate(samples).items()):
+        print(f"      {type_name}: {totals['instances']} instance(s), "
+              f"{totals.get('size', totals.get('current_size', 0))} items")
+
+
+def demonstrate_background_collection():
+    """Write Prometheus and JSON lines files from a background thread"""
+    print(f"\n🧵 Background Collection:")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        prometheus_path = os.path.join(directory, "containers.prom")
+        jsonl_path = os.path.join(directory, "containers.jsonl")
+        
+        registry = MetricsRegistry(interval=0.01, prometheus_path=prometheus_path,
+                                   jsonl_path=jsonl_path)
+        queue = CircularQueue(100)
+        registry.register(queue, label="ingest")
+        
+        with registry:
+            for i in range(50):
+                queue.enqueue(i)
+                time.sleep(0.001)
+        
+        with open(jsonl_path) as f:
+            records = f.readlines()
+        print(f"    JSON lines written: {len(records)}")
+        print(f"    Last record: {records[-1].strip()[:100]}...")
+        print(f"    Registry stats: {registry.get_stats()}")
+
+
+# ============================================================================
+# MAIN DEMONSTRATION FUNCTION
+# ============================================================================
+
+def main():
+    """Run all metrics registry demonstrations"""
+    print("📈 CONTAINER METRICS - CSC 242 Week 3")
+    print("=" * 60)
+    
+    demonstrate_registry()
+    demonstrate_background_collection()
+    
+    print(f"\n" + "=" * 60)
+    print("✅ All metrics demonstrations complete!")
+    
+    print(f"\n💡 Key Metrics Concepts:")
+    print(f"   1. Weak references let observers watch without owning")
+    print(f"   2. Scraping only O(1) get_stats() keeps collection cheap")
+    print(f"   3. Standard formats plug into existing monitoring tools")
+
+
+if __name__ == "__main__":
+    main()
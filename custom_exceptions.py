@@ -12,9 +12,19 @@ This file demonstrates comprehensive exception handling:
 Author: CSC 242 Teaching Team
 """
 
+import json
+import os
+import random
+import struct
 import sys
+import tempfile
+import threading
+import time
 import traceback
+from array import array
+from collections import deque
 from datetime import datetime
+from itertools import groupby, islice
 
 
 # ============================================================================
@@ -113,27 +123,112 @@ def demonstrate_exception_handling_patterns():
 # CUSTOM EXCEPTION CLASSES
 # ============================================================================
 
+# Anchors for turning monotonic exception timestamps into wall-clock times
+_WALL_ANCHOR_NS = time.time_ns()
+_MONOTONIC_ANCHOR_NS = time.monotonic_ns()
+
+
+# Values of these types cannot change after the exception is raised, so
+# formatting them later gives the same text as formatting them now
+_IMMUTABLE_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None)})
+
+
+class _Deferred:
+    """Context value whose formatting is postponed until it is read"""
+    
+    __slots__ = ('formatter', 'value')
+    
+    def __init__(self, formatter, value):
+        self.formatter = formatter
+        self.value = value
+
+
+def _wall_clock(timestamp_ns):
+    """Convert a time.monotonic_ns() reading into a wall-clock datetime"""
+    return datetime.fromtimestamp((_WALL_ANCHOR_NS + timestamp_ns - _MONOTONIC_ANCHOR_NS) / 1e9)
+
+
 class DataStructureError(Exception):
-    """Base exception for all data structure errors"""
-    
-    def __init__(self, message, error_code=None, timestamp=None):
-        """Initialize with message and optional metadata"""
-        super().__init__(message)
-        self.error_code = error_code
-        self.timestamp = timestamp or datetime.now()
-        self.context = {}
-    
-    def add_context(self, key, value):
-        """Add context information to the exception"""
-        self.context[key] = value
+    """Base exception for all data structure errors
+    
+    Raising and catching should be cheap: construction only records a
+    monotonic timestamp and the raw values. The message, the datetime and
+    any formatted context are built the first time they are read.
+    """
+    
+    error_code = None
+    _message = None
+    _timestamp = None
+    _context = None
+    
+    def __init__(self, message=None, error_code=None, timestamp=None):
+        """Initialize with message and optional metadata
+        
+        BaseException already keeps the constructor arguments in self.args,
+        so subclasses call super().__init__() without a message, store their
+        fields and override _format_message; error_code is a class attribute.
+        """
+        if message is not None:
+            self._message = message
+        if error_code is not None:
+            self.error_code = error_code
+        if timestamp is not None:
+            self._timestamp = timestamp
+        self.timestamp_ns = time.monotonic_ns()
+    
+    def _format_message(self):
+        """Build the message from the exception's fields"""
+        return ""
+    
+    @property
+    def message(self):
+        """Human-readable message (formatted on first access)"""
+        if self._message is None:
+            self._message = self._format_message()
+        return self._message
+    
+    @property
+    def timestamp(self):
+        """Wall-clock datetime of construction (converted on first access)"""
+        if self._timestamp is None:
+            self._timestamp = _wall_clock(self.timestamp_ns)
+        return self._timestamp
+    
+    @property
+    def context(self):
+        """Context dict, with deferred values formatted on first access"""
+        if self._context is None:
+            self._context = {}
+        for key, value in self._context.items():
+            if type(value) is _Deferred:
+                self._context[key] = value.formatter(value.value)
+        return self._context
+    
+    def add_context(self, key, value, formatter=None):
+        """Add context information to the exception
+        
+        If formatter is given (e.g. repr), it is applied to an immutable
+        value (number, string, bytes, None) only when the context is read or
+        the exception is rendered. Any other value is formatted right away:
+        a deferred reference to a mutable item would report the item as it
+        is when read, not as it was when the error was raised.
+        """
+        if self._context is None:
+            self._context = {}
+        if formatter is not None:
+            if type(value) in _IMMUTABLE_TYPES:
+                value = _Deferred(formatter, value)
+            else:
+                value = formatter(value)
+        self._context[key] = value
         return self
     
     def __str__(self):
         """Enhanced string representation"""
-        base_msg = super().__str__()
+        base_msg = self.message
         if self.error_code:
             base_msg = f"[{self.error_code}] {base_msg}"
-        if self.context:
+        if self._context:
             context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
             base_msg = f"{base_msg} (Context: {context_str})"
         return base_msg
@@ -142,50 +237,69 @@ class DataStructureError(Exception):
 class EmptyContainerError(DataStructureError):
     """Raised when operating on empty containers"""
     
+    error_code = "EMPTY_CONTAINER"
+    
     def __init__(self, container_type, operation):
         """Initialize with container type and operation"""
-        message = f"Cannot {operation} from empty {container_type}"
-        super().__init__(message, error_code="EMPTY_CONTAINER")
+        super().__init__()  # Message is formatted from the fields on demand
         self.container_type = container_type
         self.operation = operation
+    
+    def _format_message(self):
+        return f"Cannot {self.operation} from empty {self.container_type}"
 
 
 class FullContainerError(DataStructureError):
     """Raised when adding to full containers"""
     
+    error_code = "FULL_CONTAINER"
+    
     def __init__(self, container_type, capacity, operation="add"):
         """Initialize with container info"""
-        message = f"Cannot {operation} to full {container_type} (capacity: {capacity})"
-        super().__init__(message, error_code="FULL_CONTAINER")
+        super().__init__()  # Message is formatted from the fields on demand
         self.container_type = container_type
         self.capacity = capacity
         self.operation = operation
+    
+    def _format_message(self):
+        return (f"Cannot {self.operation} to full {self.container_type} "
+                f"(capacity: {self.capacity})")
 
 
 class InvalidIndexError(DataStructureError):
     """Raised for invalid index operations"""
     
+    error_code = "INVALID_INDEX"
+    
     def __init__(self, index, container_size, container_type="container"):
         """Initialize with index information"""
-        message = f"Invalid index {index} for {container_type} of size {container_size}"
-        super().__init__(message, error_code="INVALID_INDEX")
+        super().__init__()  # Message is formatted from the fields on demand
         self.index = index
         self.container_size = container_size
         self.container_type = container_type
+    
+    def _format_message(self):
+        return (f"Invalid index {self.index} for {self.container_type} "
+                f"of size {self.container_size}")
 
 
 class ConfigurationError(DataStructureError):
     """Raised for invalid configuration"""
     
+    error_code = "INVALID_CONFIG"
+    
     def __init__(self, parameter, value, expected=None):
         """Initialize with configuration details"""
-        message = f"Invalid configuration: {parameter}={value}"
-        if expected:
-            message += f" (expected: {expected})"
-        super().__init__(message, error_code="INVALID_CONFIG")
+        super().__init__()  # Message is formatted from the fields on demand
         self.parameter = parameter
         self.value = value
         self.expected = expected
+    
+    def _format_message(self):
+        message = f"Invalid configuration: {self.parameter}={self.value}"
+        if self.expected:
+            message += f" (expected: {self.expected})"
+        return message
 
 
 # ============================================================================
@@ -234,27 +348,113 @@ class StackOverflowError(StackError, FullContainerError):
 # CONTAINER CLASSES WITH CUSTOM EXCEPTIONS
 # ============================================================================
 
-class SafeQueue:
-    """Queue implementation with comprehensive exception handling"""
+class _EmptySentinel:
+    """Marker returned by the non-raising try_*/poll methods on a miss"""
     
-    def __init__(self, max_size=None):
-        """Initialize queue with optional capacity limit"""
+    def __bool__(self):
+        return False
+    
+    def __repr__(self):
+        return "EMPTY"
+
+
+EMPTY = _EmptySentinel()
+
+
+# What enqueue does when a bounded SafeQueue is full (or pass a callable)
+OVERFLOW_POLICIES = ('raise', 'block', 'drop_oldest', 'drop_newest')
+
+
+class SafeQueue:
+    """Queue implementation with comprehensive exception handling
+    
+    overflow_policy decides what enqueue does when the queue is full:
+    'raise' FullQueueError, 'block' until space frees up (FullQueueError
+    after timeout seconds, if given), 'drop_oldest' to make room,
+    'drop_newest' to discard the new item, or a callable
+    callback(queue, item) that takes responsibility for the item.
+    """
+    
+    _not_full = None  # threading.Condition, only for the 'block' policy
+    # A refused call leaves the queue unchanged, so a batch may record it as
+    # the failure of the identical calls after it instead of making them
+    shares_batch_failures = True
+    
+    def __init__(self, max_size=None, overflow_policy='raise', timeout=None):
+        """Initialize queue with optional capacity limit and overflow policy"""
         if max_size is not None and max_size <= 0:
             raise ConfigurationError("max_size", max_size, "positive integer or None")
+        if overflow_policy not in OVERFLOW_POLICIES and not callable(overflow_policy):
+            raise ConfigurationError("overflow_policy", overflow_policy,
+                                     f"one of {OVERFLOW_POLICIES} or a callable")
+        if timeout is not None and timeout < 0:
+            raise ConfigurationError("timeout", timeout, "non-negative number or None")
         
-        self._items = []
+        self._items = deque()  # O(1) at both ends
         self._max_size = max_size
+        self._overflow_policy = overflow_policy
+        self._timeout = timeout
+        if overflow_policy == 'block':
+            self._not_full = threading.Condition()
+            self.shares_batch_failures = False  # Other threads can make room
+        self._overflows = {'raised': 0, 'blocked': 0, 'block_timeouts': 0,
+                           'dropped_oldest': 0, 'dropped_newest': 0, 'callbacks': 0}
     
     def enqueue(self, item):
-        """Add item to rear of queue"""
+        """Add item to rear of queue (applying the overflow policy if full)"""
+        if self._not_full is not None:
+            self._enqueue_blocking(item)
+            return
         if self._max_size and len(self._items) >= self._max_size:
-            exc = FullQueueError(self._max_size)
-            exc.add_context("current_size", len(self._items))
-            exc.add_context("attempted_item", repr(item))
-            raise exc
+            self._overflow(item)
+            return
         
         self._items.append(item)
     
+    def _enqueue_blocking(self, item):
+        """'block' policy: check for room and append under the condition
+        
+        Producers only add while holding the condition, so two of them can
+        never both see the last free slot.
+        """
+        with self._not_full:
+            if self._max_size and len(self._items) >= self._max_size:
+                self._overflows['blocked'] += 1
+                if not self._not_full.wait_for(
+                        lambda: len(self._items) < self._max_size, self._timeout):
+                    self._overflows['block_timeouts'] += 1
+                    self._raise_full(item)
+            self._items.append(item)
+    
+    def _overflow(self, item):
+        """Apply the overflow policy to an item that did not fit"""
+        policy = self._overflow_policy
+        if policy == 'drop_oldest':
+            self._overflows['dropped_oldest'] += 1
+            self._items.popleft()
+            self._items.append(item)
+        elif policy == 'drop_newest':
+            self._overflows['dropped_newest'] += 1
+        elif policy == 'raise':
+            self._overflows['raised'] += 1
+            self._raise_full(item)
+        else:
+            self._overflows['callbacks'] += 1
+            policy(self, item)
+    
+    def _raise_full(self, item):
+        exc = FullQueueError(self._max_size)
+        exc.add_context("current_size", len(self._items))
+        exc.add_context("attempted_item", item, repr)
+        if self._overflow_policy == 'block':
+            exc.add_context("timeout", self._timeout)
+        raise exc
+    
+    def _notify_not_full(self):
+        """Wake one producer blocked in enqueue (block policy only)"""
+        with self._not_full:
+            self._not_full.notify()
+    
     def dequeue(self):
         """Remove and return item from front of queue"""
         if not self._items:
@@ -263,7 +463,56 @@ class SafeQueue:
             exc.add_context("capacity", self._max_size)
             raise exc
         
-        return self._items.pop(0)
+        item = self._items.popleft()
+        if self._not_full is not None:
+            self._notify_not_full()
+        return item
+    
+    def enqueue_many(self, items):
+        """Enqueue every item in order, or none of them if they do not all fit
+        
+        Capacity is checked once and the overflow policy is not applied. On
+        failure the error's "available" context is the free room, so the
+        caller can split the batch.
+        """
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        if self._not_full is not None:
+            with self._not_full:
+                self._enqueue_many(items)
+        else:
+            self._enqueue_many(items)
+    
+    def _enqueue_many(self, items):
+        if self._max_size and len(self._items) + len(items) > self._max_size:
+            exc = FullQueueError(self._max_size, "enqueue_many")
+            exc.add_context("current_size", len(self._items))
+            exc.add_context("attempted_count", len(items))
+            exc.add_context("available", self._max_size - len(self._items))
+            raise exc
+        
+        self._items.extend(items)
+    
+    def dequeue_many(self, n):
+        """Remove and return the front n items, or none if fewer exist
+        
+        On failure the error's "available" context is the current size.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if n > len(self._items):
+            exc = EmptyQueueError("dequeue_many")
+            exc.add_context("current_size", len(self._items))
+            exc.add_context("requested_count", n)
+            exc.add_context("available", len(self._items))
+            raise exc
+        
+        popleft = self._items.popleft
+        removed = [popleft() for _ in range(n)]
+        if self._not_full is not None and removed:
+            with self._not_full:
+                self._not_full.notify(n)
+        return removed
     
     def front(self):
         """Return front item without removing it"""
@@ -271,6 +520,37 @@ class SafeQueue:
             raise EmptyQueueError("peek at front")
         return self._items[0]
     
+    # Non-raising fast paths: no exception objects are built on a miss
+    def offer(self, item):
+        """Add item to rear if there is room; return whether it was added"""
+        if self._not_full is not None:
+            with self._not_full:
+                return self._offer(item)
+        return self._offer(item)
+    
+    def _offer(self, item):
+        if self._max_size and len(self._items) >= self._max_size:
+            return False
+        self._items.append(item)
+        return True
+    
+    def try_dequeue(self, default=EMPTY):
+        """Remove and return front item, or default if the queue is empty"""
+        if self._items:
+            item = self._items.popleft()
+            if self._not_full is not None:
+                self._notify_not_full()
+            return item
+        return default
+    
+    poll = try_dequeue  # Conventional name for polling consumers
+    
+    def try_front(self, default=EMPTY):
+        """Return front item without removing it, or default if empty"""
+        if self._items:
+            return self._items[0]
+        return default
+    
     def size(self):
         """Return current size"""
         return len(self._items)
@@ -287,6 +567,24 @@ class SafeQueue:
         """Return maximum capacity"""
         return self._max_size
     
+    def remaining_capacity(self):
+        """Return free slots, or None when the queue is unbounded"""
+        if not self._max_size:
+            return None
+        return max(self._max_size - len(self._items), 0)
+    
+    def get_stats(self):
+        """Return size, capacity and how often each overflow policy fired"""
+        policy = self._overflow_policy
+        return {
+            'type': type(self).__name__,
+            'size': len(self._items),
+            'capacity': self._max_size,
+            'overflow_policy': policy if isinstance(policy, str) else 'callback',
+            'overflow_timeout': self._timeout,
+            **{f'overflow_{event}': count for event, count in self._overflows.items()}
+        }
+    
     def __len__(self):
         return len(self._items)
     
@@ -303,6 +601,9 @@ class SafeQueue:
 class SafeStack:
     """Stack implementation with comprehensive exception handling"""
     
+    # A refused call leaves the stack unchanged (see SafeQueue)
+    shares_batch_failures = True
+    
     def __init__(self, max_size=None):
         """Initialize stack with optional capacity limit"""
         if max_size is not None and max_size <= 0:
@@ -316,7 +617,7 @@ class SafeStack:
         if self._max_size and len(self._items) >= self._max_size:
             exc = StackOverflowError(self._max_size)
             exc.add_context("current_size", len(self._items))
-            exc.add_context("attempted_item", repr(item))
+            exc.add_context("attempted_item", item, repr)
             raise exc
         
         self._items.append(item)
@@ -331,12 +632,71 @@ class SafeStack:
         
         return self._items.pop()
     
+    def push_many(self, items):
+        """Push every item in order, or none of them if they do not all fit
+        
+        Capacity is checked once and the items are added with one extend. On
+        failure the error's "available" context is the free room, so the
+        caller can split the batch.
+        """
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        if self._max_size and len(self._items) + len(items) > self._max_size:
+            exc = StackOverflowError(self._max_size, "push_many")
+            exc.add_context("current_size", len(self._items))
+            exc.add_context("attempted_count", len(items))
+            exc.add_context("available", self._max_size - len(self._items))
+            raise exc
+        
+        self._items.extend(items)
+    
+    def pop_many(self, n):
+        """Remove and return the top n items (top first), or none if fewer exist
+        
+        On failure the error's "available" context is the current size.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if n > len(self._items):
+            exc = EmptyStackError("pop_many")
+            exc.add_context("current_size", len(self._items))
+            exc.add_context("requested_count", n)
+            exc.add_context("available", len(self._items))
+            raise exc
+        if n == 0:
+            return []
+        
+        popped = self._items[-n:]
+        del self._items[-n:]
+        popped.reverse()
+        return popped
+    
     def peek(self):
         """Return top item without removing it"""
         if not self._items:
             raise EmptyStackError("peek at top")
         return self._items[-1]
     
+    # Non-raising fast paths: no exception objects are built on a miss
+    def try_push(self, item):
+        """Push item if there is room; return whether it was pushed"""
+        if self._max_size and len(self._items) >= self._max_size:
+            return False
+        self._items.append(item)
+        return True
+    
+    def try_pop(self, default=EMPTY):
+        """Remove and return top item, or default if the stack is empty"""
+        if self._items:
+            return self._items.pop()
+        return default
+    
+    def try_peek(self, default=EMPTY):
+        """Return top item without removing it, or default if empty"""
+        if self._items:
+            return self._items[-1]
+        return default
+    
     def size(self):
         """Return current size"""
         return len(self._items)
@@ -349,6 +709,12 @@ class SafeStack:
         """Check if stack is full"""
         return self._max_size and len(self._items) >= self._max_size
     
+    def remaining_capacity(self):
+        """Return free slots, or None when the stack is unbounded"""
+        if not self._max_size:
+            return None
+        return max(self._max_size - len(self._items), 0)
+    
     def __len__(self):
         return len(self._items)
     
@@ -366,65 +732,450 @@ class SafeStack:
 # EXCEPTION CONTEXT AND DEBUGGING
 # ============================================================================
 
-class DebuggingQueue(SafeQueue):
-    """Queue with enhanced debugging capabilities"""
+# Operation codes stored in trace records (0 means "no operation")
+TRACE_OPERATIONS = ('enqueue', 'dequeue', 'offer', 'try_dequeue')
+_TRACE_CODES = {name: code for code, name in enumerate(TRACE_OPERATIONS, start=1)}
+
+# Dump layout: header (magic, version, little-endian flag, capacity,
+# sample_every, seen, count), then one column per field, oldest first
+_TRACE_MAGIC = b'OPTR'
+_TRACE_HEADER = struct.Struct('<4sBBxxIIQQ')
+_TRACE_COLUMNS = (('ops', 'B'), ('timestamps_ns', 'q'),
+                  ('sizes_before', 'q'), ('item_ids', 'Q'))
+
+
+class OperationTrace:
+    """Fixed-capacity ring buffer of compact operation records
+    
+    Each record is an op code, a time.monotonic_ns() timestamp, the container
+    size before the operation and id() of the item involved, held in parallel
+    typed arrays. Only every sample_every-th operation is recorded, and the
+    oldest records are overwritten once the ring is full.
+    """
+    
+    def __init__(self, capacity=1024, sample_every=1):
+        """Preallocate capacity records; nothing grows afterwards"""
+        if capacity <= 0:
+            raise ConfigurationError("capacity", capacity, "positive integer")
+        if sample_every <= 0:
+            raise ConfigurationError("sample_every", sample_every, "positive integer")
+        
+        self.capacity = capacity
+        self.sample_every = sample_every
+        self.seen = 0       # Operations offered to the trace
+        self.recorded = 0   # Records written (including overwritten ones)
+        self._ops = array('B', bytes(capacity))
+        self._timestamps = array('q', [0]) * capacity
+        self._sizes = array('q', [0]) * capacity
+        self._item_ids = array('Q', [0]) * capacity
+    
+    def record(self, op_code, size_before, item_id=0):
+        """Record one operation if it falls on the sampling interval"""
+        self.seen += 1
+        if self.seen % self.sample_every:
+            return
+        slot = self.recorded % self.capacity
+        self._ops[slot] = op_code
+        self._timestamps[slot] = time.monotonic_ns()
+        self._sizes[slot] = size_before
+        self._item_ids[slot] = item_id
+        self.recorded += 1
     
-    def __init__(self, max_size=None, debug_mode=False):
-        """Initialize with debugging options"""
-        super().__init__(max_size)
-        self.debug_mode = debug_mode
-        self.operation_history = []
-        self.error_history = []
+    def __len__(self):
+        return min(self.recorded, self.capacity)
+    
+    def _slots(self):
+        """Slot indexes of the retained records, oldest first"""
+        count = len(self)
+        first = self.recorded - count
+        return [(first + i) % self.capacity for i in range(count)]
+    
+    def records(self, last=None):
+        """Decode retained records (or only the last few) into dicts"""
+        slots = self._slots()
+        if last is not None:
+            slots = slots[len(slots) - last:] if last > 0 else []
+        return [{
+            'operation': TRACE_OPERATIONS[self._ops[slot] - 1],
+            'timestamp_ns': self._timestamps[slot],
+            'state_before': self._sizes[slot],
+            'item_id': self._item_ids[slot]
+        } for slot in slots]
+    
+    def nbytes(self):
+        """Bytes held by the record arrays"""
+        return sum(column.itemsize * len(column) for column in
+                   (self._ops, self._timestamps, self._sizes, self._item_ids))
+    
+    def dump(self, path):
+        """Write retained records to a binary file for offline analysis"""
+        slots = self._slots()
+        columns = (self._ops, self._timestamps, self._sizes, self._item_ids)
+        with open(path, 'wb') as f:
+            f.write(_TRACE_HEADER.pack(_TRACE_MAGIC, 1, sys.byteorder == 'little',
+                                       self.capacity, self.sample_every,
+                                       self.seen, len(slots)))
+            for column in columns:
+                ordered = array(column.typecode, (column[slot] for slot in slots))
+                ordered.tofile(f)
+    
+    @staticmethod
+    def load(path):
+        """Read a dump back as {'header': ..., column name: array}"""
+        with open(path, 'rb') as f:
+            (magic, version, little_endian, capacity, sample_every,
+             seen, count) = _TRACE_HEADER.unpack(f.read(_TRACE_HEADER.size))
+            if magic != _TRACE_MAGIC or version != 1:
+                raise ValueError(f"{path} is not an operation trace dump")
+            
+            trace = {'header': {'capacity': capacity, 'sample_every': sample_every,
+                                'seen': seen, 'count': count}}
+            for name, typecode in _TRACE_COLUMNS:
+                column = array(typecode)
+                column.fromfile(f, count)
+                if bool(little_endian) != (sys.byteorder == 'little'):
+                    column.byteswap()
+                trace[name] = column
+        return trace
+
+
+class ExceptionLogSink:
+    """Structured exception logging that never blocks the failing operation
+    
+    log() only captures raw fields (type, error_code, timestamp_ns and a
+    shallow copy of the context) and appends them to a bounded in-memory
+    ring, or counts a drop when the ring is full. A background thread
+    formats the message, converts the timestamp, builds the records and
+    appends them to path as JSON lines, one batched write per drain.
+    
+    The queued entry keeps a reference to the exception (and so to its
+    traceback) until it is written; the writer only reads the fields set
+    when it was constructed, so it never formats or caches anything on it.
+    """
+    
+    # Context values shared with the writer as they are; others are repr'd
+    _SHAREABLE = _IMMUTABLE_TYPES | {_Deferred}
+    
+    def __init__(self, path, capacity=4096, batch_size=256, flush_interval=0.5):
+        """Configure output file, ring capacity and batching"""
+        if capacity <= 0:
+            raise ConfigurationError("capacity", capacity, "positive integer")
+        if batch_size <= 0:
+            raise ConfigurationError("batch_size", batch_size, "positive integer")
+        if flush_interval <= 0:
+            raise ConfigurationError("flush_interval", flush_interval, "positive number")
+        
+        self._path = path
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._ring = deque()  # append/popleft are atomic, so no lock is needed
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._file = None
+        self._logged = 0
+        self._dropped = 0
+        self._written = 0
+        self._batches = 0
+        self._write_errors = 0
+    
+    def log(self, error, operation=None):
+        """Queue error for logging; return False if it had to be dropped"""
+        if len(self._ring) >= self._capacity:
+            self._dropped += 1
+            return False
+        self._ring.append(self._snapshot(error, operation))
+        self._logged += 1
+        if len(self._ring) >= self._batch_size:
+            self._wakeup.set()
+        return True
+    
+    @classmethod
+    def _snapshot(cls, error, operation):
+        """Raw fields of error for the writer thread (nothing is formatted)
+        
+        The context is copied so later add_context calls do not leak into
+        the record. Immutable and deferred values are shared; a mutable
+        value is repr'd now, as it is when the error is logged.
+        """
+        context = (error._context if isinstance(error, DataStructureError)
+                   else getattr(error, 'context', None))
+        if context:
+            context = {key: value if type(value) in cls._SHAREABLE else repr(value)
+                       for key, value in context.items()}
+        return (type(error), getattr(error, 'error_code', None),
+                getattr(error, 'timestamp_ns', None) or time.monotonic_ns(),
+                context, operation, error)
+    
+    @staticmethod
+    def _build_record(snapshot):
+        """Structured, JSON-ready record from a _snapshot() tuple"""
+        error_type, error_code, timestamp_ns, context, operation, error = snapshot
+        if isinstance(error, DataStructureError):
+            message = error._message
+            if message is None:
+                message = error._format_message()  # Not cached: the exception is not ours
+        else:
+            message = getattr(error, 'message', None) or str(error)
+        record = {
+            'timestamp': _wall_clock(timestamp_ns).isoformat(),
+            'timestamp_ns': timestamp_ns,
+            'error_type': error_type.__name__,
+            'error_code': error_code,
+            'message': message,
+            'context': {key: value.formatter(value.value) if type(value) is _Deferred else value
+                        for key, value in (context or {}).items()}
+        }
+        if operation is not None:
+            record['operation'] = operation
+        return record
+    
+    @classmethod
+    def to_record(cls, error, operation=None):
+        """Structured, JSON-ready view of an exception (leaves it unchanged)"""
+        return cls._build_record(cls._snapshot(error, operation))
+    
+    def _drain(self):
+        """Build and write everything queued so far in batches (writer thread only)"""
+        while self._ring:
+            batch = []
+            while self._ring and len(batch) < self._batch_size:
+                batch.append(self._build_record(self._ring.popleft()))
+            lines = "".join(json.dumps(record, default=str) + "\n" for record in batch)
+            try:
+                self._file.write(lines)
+                self._file.flush()
+            except OSError:
+                self._write_errors += 1
+                continue
+            self._written += len(batch)
+            self._batches += 1
+    
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            self._drain()
+        self._drain()
+    
+    def start(self):
+        """Open the output file and start the writer thread"""
+        if self._thread is not None:
+            raise RuntimeError("sink is already running")
+        
+        self._file = open(self._path, "a")
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="exception-log-sink",
+                                        daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Flush everything queued, stop the writer thread and close the file"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._wakeup.set()
+        self._thread.join()
+        self._thread = None
+        self._file.close()
+        self._file = None
+    
+    def get_stats(self):
+        """Return the sink's statistics"""
+        return {
+            'type': 'ExceptionLogSink',
+            'path': self._path,
+            'capacity': self._capacity,
+            'pending': len(self._ring),
+            'logged': self._logged,
+            'dropped': self._dropped,
+            'written': self._written,
+            'batches': self._batches,
+            'write_errors': self._write_errors,
+            'running': self._thread is not None
+        }
+    
+    def __enter__(self):
+        self.start()
+        return self
     
-    def _log_operation(self, operation, *args, **kwargs):
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class DebuggingQueue(SafeQueue):
+    """Queue with enhanced debugging capabilities
+    
+    Operations go to a bounded OperationTrace. Errors are aggregated into
+    counters keyed by (error_code, operation) with first/last timestamps,
+    plus a reservoir sample and the last few instances, so debug mode uses
+    constant memory and formats nothing until the errors are inspected.
+    """
+    
+    RECENT_ERRORS = 3
+    shares_batch_failures = False  # Every failed call is traced and logged
+    
+    def __init__(self, max_size=None, debug_mode=False, trace_capacity=1024,
+                 sample_every=1, error_sample_size=8, log_sink=None,
+                 overflow_policy='raise', timeout=None):
+        """Initialize with debugging options (log_sink: an ExceptionLogSink)"""
+        if error_sample_size < 0:
+            raise ConfigurationError("error_sample_size", error_sample_size,
+                                     "non-negative integer")
+        super().__init__(max_size, overflow_policy, timeout)
+        self.debug_mode = debug_mode
+        self.trace = OperationTrace(trace_capacity, sample_every)
+        self._error_stats = {}  # (error_code, operation) -> [count, first_ns, last_ns]
+        self._error_sample = []
+        self._error_sample_size = error_sample_size
+        self._recent_errors = deque(maxlen=self.RECENT_ERRORS)
+        self._error_count = 0
+        self.log_sink = log_sink
+    
+    def _log_operation(self, operation, item_id=0):
         """Log operation for debugging"""
         if self.debug_mode:
-            entry = {
-                'timestamp': datetime.now(),
-                'operation': operation,
-                'args': args,
-                'kwargs': kwargs,
-                'state_before': len(self._items)
-            }
-            self.operation_history.append(entry)
-    
-    def _log_error(self, error, operation, *args):
-        """Log error for debugging"""
-        error_entry = {
-            'timestamp': datetime.now(),
+            self.trace.record(_TRACE_CODES[operation], len(self._items), item_id)
+    
+    def _front_id(self):
+        """id() of the item a dequeue would remove (0 when empty)"""
+        return id(self._items[0]) if self._items else 0
+    
+    def _log_batch(self, operation, item_ids):
+        """Log one record per batch item, as the single-item calls would"""
+        code = _TRACE_CODES[operation]
+        size = len(self._items)
+        step = 1 if operation == 'enqueue' else -1
+        for item_id in item_ids:
+            self.trace.record(code, size, item_id)
+            size = max(size + step, 0)
+    
+    def _log_error(self, error, operation):
+        """Aggregate an error (O(1) time and memory, no formatting)"""
+        self._error_count += 1
+        timestamp_ns = getattr(error, 'timestamp_ns', None) or time.monotonic_ns()
+        key = (getattr(error, 'error_code', None) or type(error).__name__, operation)
+        
+        stats = self._error_stats.get(key)
+        if stats is None:
+            self._error_stats[key] = [1, timestamp_ns, timestamp_ns]
+        else:
+            stats[0] += 1
+            stats[2] = timestamp_ns
+        
+        entry = (timestamp_ns, operation, len(self._items), error)
+        self._recent_errors.append(entry)
+        
+        # Reservoir sampling (Algorithm R): every error is equally likely to be kept
+        if len(self._error_sample) < self._error_sample_size:
+            self._error_sample.append(entry)
+        else:
+            slot = random.randrange(self._error_count)
+            if slot < self._error_sample_size:
+                self._error_sample[slot] = entry
+        
+        if self.log_sink is not None:
+            self.log_sink.log(error, operation)
+    
+    @property
+    def operation_history(self):
+        """Retained operation records, oldest first"""
+        return self.trace.records()
+    
+    @staticmethod
+    def _render_errors(entries):
+        """Render (timestamp_ns, operation, size, error) entries into dicts"""
+        return [{
+            'timestamp_ns': timestamp_ns,
             'error_type': type(error).__name__,
             'error_message': str(error),
             'operation': operation,
-            'args': args,
-            'queue_state': len(self._items)
-        }
-        self.error_history.append(error_entry)
+            'queue_state': queue_state
+        } for timestamp_ns, operation, queue_state, error in entries]
+    
+    @property
+    def error_history(self):
+        """Sampled error records, oldest first"""
+        return self._render_errors(sorted(self._error_sample, key=lambda entry: entry[0]))
+    
+    def get_error_stats(self):
+        """Return aggregated error counters, most frequent first"""
+        return sorted(({
+            'error_code': error_code,
+            'operation': operation,
+            'count': count,
+            'first_timestamp_ns': first_ns,
+            'last_timestamp_ns': last_ns
+        } for (error_code, operation), (count, first_ns, last_ns)
+            in self._error_stats.items()), key=lambda stats: -stats['count'])
     
     def enqueue(self, item):
         """Enqueue with debugging"""
-        self._log_operation('enqueue', item)
+        self._log_operation('enqueue', id(item))
         try:
             super().enqueue(item)
         except Exception as e:
-            self._log_error(e, 'enqueue', item)
+            self._log_error(e, 'enqueue')
             raise
     
     def dequeue(self):
         """Dequeue with debugging"""
-        self._log_operation('dequeue')
+        self._log_operation('dequeue', self._front_id())
         try:
             return super().dequeue()
         except Exception as e:
             self._log_error(e, 'dequeue')
             raise
     
+    def enqueue_many(self, items):
+        """Batch enqueue with debugging (one trace record per item)"""
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        if self.debug_mode:
+            self._log_batch('enqueue', map(id, items))
+        try:
+            super().enqueue_many(items)
+        except Exception as e:
+            self._log_error(e, 'enqueue_many')
+            raise
+    
+    def dequeue_many(self, n):
+        """Batch dequeue with debugging (one trace record per item)"""
+        if self.debug_mode and n > 0:
+            item_ids = [id(item) for item in islice(self._items, n)]
+            item_ids += [0] * (n - len(item_ids))  # Past the end, as on an empty queue
+            self._log_batch('dequeue', item_ids)
+        try:
+            return super().dequeue_many(n)
+        except Exception as e:
+            self._log_error(e, 'dequeue_many')
+            raise
+    
+    def offer(self, item):
+        """Offer with debugging (a refusal is not an error)"""
+        self._log_operation('offer', id(item))
+        return super().offer(item)
+    
+    def try_dequeue(self, default=EMPTY):
+        """Non-raising dequeue with debugging"""
+        self._log_operation('try_dequeue', self._front_id())
+        return super().try_dequeue(default)
+    
+    poll = try_dequeue
+    
     def get_debug_info(self):
         """Return debugging information"""
         return {
-            'operation_count': len(self.operation_history),
-            'error_count': len(self.error_history),
-            'recent_operations': self.operation_history[-5:],
-            'recent_errors': self.error_history[-3:],
+            'operation_count': self.trace.seen,
+            'operations_recorded': len(self.trace),
+            'sample_every': self.trace.sample_every,
+            'trace_bytes': self.trace.nbytes(),
+            'error_count': self._error_count,
+            'error_stats': self.get_error_stats(),
+            'recent_operations': self.trace.records(last=5),
+            'recent_errors': self._render_errors(self._recent_errors),
+            'error_sample': self.error_history,
             'current_state': {
                 'size': len(self._items),
                 'capacity': self._max_size,
@@ -434,6 +1185,223 @@ class DebuggingQueue(SafeQueue):
         }
 
 
+# ============================================================================
+# BATCH OPERATIONS
+# ============================================================================
+
+# Op codes for compiled batches; each accepts the queue and the stack name
+OP_ADD, OP_REMOVE, OP_PEEK = 0, 1, 2
+_OP_CODES = {'enqueue': OP_ADD, 'push': OP_ADD,
+             'dequeue': OP_REMOVE, 'pop': OP_REMOVE,
+             'peek': OP_PEEK, 'front': OP_PEEK}
+
+# Per-entry status codes
+STATUS_OK, STATUS_EMPTY, STATUS_FULL, STATUS_ERROR = 0, 1, 2, 3
+
+# container type -> {op code: (single method, bulk method or None)}
+_BATCH_TABLES = {
+    SafeQueue: {OP_ADD: ('enqueue', 'enqueue_many'),
+                OP_REMOVE: ('dequeue', 'dequeue_many'),
+                OP_PEEK: ('front', None)},
+    SafeStack: {OP_ADD: ('push', 'push_many'),
+                OP_REMOVE: ('pop', 'pop_many'),
+                OP_PEEK: ('peek', None)},
+}
+
+
+def compile_operations(operations):
+    """Turn ("enqueue", item) / ("dequeue",) tuples into (codes, args)
+    
+    codes is an array of op codes; args[i] is the item for OP_ADD entries
+    and None otherwise. Compile once to replay the same batch cheaply.
+    """
+    codes = array('B')
+    args = []
+    for operation, *operands in operations:
+        if operation not in _OP_CODES:
+            raise ValueError(f"Unknown batch operation: {operation!r}")
+        codes.append(_OP_CODES[operation])
+        args.append(operands[0] if operands else None)
+    return codes, args
+
+
+class BatchResult:
+    """Compact outcome of a batch: results list, status array, sparse errors
+    
+    Successful entries only fill results[i] and status[i]; exceptions are
+    kept (and formatted) only for the entries that failed. A run of entries
+    failing with one shared exception is stored once, with the items each
+    entry attempted in args; a later entry's own exception is constructed
+    from the shared one, with its attempted_item, when it is first looked up.
+    """
+    
+    def __init__(self, size, args=None):
+        self.results = [None] * size
+        self.status = array('B', bytes(size))
+        self._args = args
+        self._errors = {}  # index -> exception, raised or already constructed
+        self._shared = []  # (start, stop, exception) for shared failure runs
+    
+    def __len__(self):
+        return len(self.status)
+    
+    def fail(self, start, stop, status, error):
+        """Mark entries start..stop-1 as failed with one shared exception"""
+        self.status[start:stop] = array('B', [status]) * (stop - start)
+        self._errors[start] = error
+        if stop - start > 1:
+            self._shared.append((start, stop, error))
+    
+    def error(self, index):
+        """Exception for one entry (None if it succeeded)"""
+        if index in self._errors:
+            return self._errors[index]
+        for start, stop, error in self._shared:
+            if start < index < stop:
+                entry = self._errors[index] = self._entry_error(error, index)
+                return entry
+        return None
+    
+    @property
+    def errors(self):
+        """index -> exception for every failed entry (a new dict per read)"""
+        return {index: self.error(index) for index in self.failed()}
+    
+    def _entry_error(self, error, index):
+        """Exception like the shared one, carrying this entry's attempted item
+        
+        Built through the class's constructor from the shared exception's
+        args; it keeps the shared failure time and copies its context.
+        """
+        context = error._context if isinstance(error, DataStructureError) else None
+        if not context or "attempted_item" not in context:
+            return error  # Nothing entry-specific to report
+        entry = type(error)(*error.args)
+        entry.timestamp_ns = error.timestamp_ns
+        for key, value in context.items():
+            entry.add_context(key, value)
+        entry.add_context("attempted_item", self._args[index], repr)
+        return entry
+    
+    def failed(self):
+        """Indexes of entries that did not succeed"""
+        return [index for index, code in enumerate(self.status) if code]
+    
+    def ok_count(self):
+        return self.status.count(STATUS_OK)
+    
+    def describe(self, index):
+        """Human-readable line for one entry (formatted on demand)"""
+        error = self.error(index)
+        if error is not None:
+            return f"⚠ {type(error).__name__}: {error}"
+        return f"✓ {self.results[index]!r}"
+    
+    def summary(self):
+        """Counts per status"""
+        counts = [0, 0, 0, 0]
+        for code in self.status:
+            counts[code] += 1
+        return {'total': len(self), 'ok': counts[STATUS_OK], 'empty': counts[STATUS_EMPTY],
+                'full': counts[STATUS_FULL], 'error': counts[STATUS_ERROR]}
+
+
+class BatchExecutor:
+    """Run batches of operations against a SafeQueue or SafeStack
+    
+    Operations dispatch through a table built once per executor. Each run
+    of same-kind operations becomes one bulk call for the part that fits
+    (enqueue_many/push_many up to the free capacity, dequeue_many/pop_many
+    up to the current size, one front/peek shared by a run of peeks); only
+    the remainder goes through the single-item methods, whose exceptions
+    are recorded for just those entries.
+    """
+    
+    def __init__(self, container):
+        """Bind the dispatch table for container's type"""
+        for container_type, table in _BATCH_TABLES.items():
+            if isinstance(container, container_type):
+                break
+        else:
+            raise ConfigurationError("container", type(container).__name__,
+                                     "SafeQueue or SafeStack")
+        
+        self.container = container
+        self._single = {code: getattr(container, single)
+                        for code, (single, bulk) in table.items()}
+        self._bulk = {code: getattr(container, bulk)
+                      for code, (single, bulk) in table.items() if bulk}
+        self._runners = {OP_ADD: self._run_adds, OP_REMOVE: self._run_removes,
+                         OP_PEEK: self._run_peeks}
+        self._share_failures = container.shares_batch_failures  # See _run_singles
+    
+    def execute(self, operations):
+        """Compile and run a list of operation tuples"""
+        return self.execute_compiled(*compile_operations(operations))
+    
+    def execute_compiled(self, codes, args=None):
+        """Run a compiled batch; args is only needed when it contains adds"""
+        result = BatchResult(len(codes), args)
+        start = 0
+        for code, run in groupby(codes):
+            length = len(list(run))
+            self._runners[code](start, start + length, args, result)
+            start += length
+        return result
+    
+    # Run handlers: fill result[start:stop] ------------------------------
+    
+    def _run_adds(self, start, stop, args, result):
+        room = self.container.remaining_capacity()
+        bulk_stop = stop if room is None else min(stop, start + room)
+        if bulk_stop > start:
+            try:
+                self._bulk[OP_ADD](args[start:bulk_stop])
+            except FullContainerError:
+                bulk_stop = start  # Another producer took the room; add one at a time
+        self._run_singles(OP_ADD, bulk_stop, stop, args, result)
+    
+    def _run_removes(self, start, stop, args, result):
+        bulk_stop = min(stop, start + len(self.container))
+        if bulk_stop > start:
+            result.results[start:bulk_stop] = self._bulk[OP_REMOVE](bulk_stop - start)
+        self._run_singles(OP_REMOVE, bulk_stop, stop, args, result)
+    
+    def _run_peeks(self, start, stop, args, result):
+        if len(self.container):
+            result.results[start:stop] = [self._single[OP_PEEK]()] * (stop - start)
+        else:
+            self._run_singles(OP_PEEK, start, stop, args, result)
+    
+    def _run_singles(self, code, start, stop, args, result):
+        """One call per entry; only failures record an exception
+        
+        A failed operation leaves the container unchanged, so the rest of
+        the run would fail the same way and shares that exception, unless
+        the container's shares_batch_failures is False (a 'block' queue,
+        which other threads may change, or a DebuggingQueue, which traces
+        and logs each failure).
+        """
+        operation = self._single[code]
+        share_failures = self._share_failures
+        for index in range(start, stop):
+            try:
+                result.results[index] = (operation(args[index]) if code == OP_ADD
+                                         else operation())
+                continue
+            except EmptyContainerError as e:
+                status, error = STATUS_EMPTY, e
+            except FullContainerError as e:
+                status, error = STATUS_FULL, e
+            except Exception as e:
+                status, error = STATUS_ERROR, e
+            
+            if share_failures:
+                result.fail(index, stop, status, error)
+                return
+            result.fail(index, index + 1, status, error)
+
+
 # ============================================================================
 # DEMONSTRATION FUNCTIONS
 # ============================================================================
@@ -552,41 +1520,295 @@ def demonstrate_debugging_features():
         print(f"    Recent errors:")
         for error in debug_info['recent_errors']:
             print(f"      - {error['error_type']}: {error['error_message']}")
+    
+    # Long-running debug mode: sampled, bounded trace with a binary dump
+    sampled_queue = DebuggingQueue(debug_mode=True, trace_capacity=256, sample_every=10)
+    for i in range(100_000):
+        sampled_queue.enqueue(i)
+        sampled_queue.dequeue()
+    
+    info = sampled_queue.get_debug_info()
+    print(f"\n  Sampled trace after {info['operation_count']:,} operations:")
+    print(f"    Records kept: {info['operations_recorded']} "
+          f"(every {info['sample_every']}th, {info['trace_bytes']:,} bytes)")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "queue.trace")
+        sampled_queue.trace.dump(path)
+        dumped = OperationTrace.load(path)
+        print(f"    Dumped {os.path.getsize(path):,} bytes; reloaded "
+              f"{dumped['header']['count']} records, last op: "
+              f"{TRACE_OPERATIONS[dumped['ops'][-1] - 1]}")
+    
+    # Error storm: aggregated counters instead of one record per failure
+    storm_queue = DebuggingQueue(max_size=1, error_sample_size=4)
+    storm_queue.enqueue("only")
+    start = time.perf_counter()
+    for i in range(50_000):
+        try:
+            storm_queue.enqueue(i)
+        except FullQueueError:
+            pass
+    storm_queue.dequeue()
+    for _ in range(50_000):
+        try:
+            storm_queue.dequeue()
+        except EmptyQueueError:
+            pass
+    elapsed = time.perf_counter() - start
+    
+    info = storm_queue.get_debug_info()
+    print(f"\n  Error storm: {info['error_count']:,} errors in {elapsed:.3f}s")
+    for stats in info['error_stats']:
+        span_ms = (stats['last_timestamp_ns'] - stats['first_timestamp_ns']) / 1e6
+        print(f"    {stats['error_code']}/{stats['operation']}: "
+              f"{stats['count']:,} over {span_ms:.1f} ms")
+    print(f"    Sampled instances kept: {len(info['error_sample'])}")
+    
+    # Structured logging off the hot path: a bounded ring feeds a background
+    # writer, and a burst larger than the ring is counted as dropped
+    # rather than blocking the failing operation
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "errors.jsonl")
+        with ExceptionLogSink(path, capacity=1024) as sink:
+            logged_queue = DebuggingQueue(max_size=1, log_sink=sink)
+            start = time.perf_counter()
+            for i in range(20_000):
+                try:
+                    logged_queue.dequeue()
+                except EmptyQueueError:
+                    pass
+            elapsed = time.perf_counter() - start
+        
+        stats = sink.get_stats()
+        with open(path) as f:
+            first_line = f.readline().strip()
+        print(f"\n  Async log sink: 20,000 failing dequeues in {elapsed:.3f}s")
+        print(f"    Written: {stats['written']:,} in {stats['batches']} batches, "
+              f"dropped: {stats['dropped']:,}")
+        print(f"    First line: {first_line[:100]}...")
+
+
+def demonstrate_overflow_policies():
+    """Show each SafeQueue overflow policy and its stats counter"""
+    print(f"\n🌊 Overflow Policies (capacity 3, enqueueing 1..5):")
+    
+    spilled = []
+    policies = ['drop_oldest', 'drop_newest', lambda queue, item: spilled.append(item)]
+    for policy in policies:
+        queue = SafeQueue(max_size=3, overflow_policy=policy)
+        for i in range(1, 6):
+            queue.enqueue(i)
+        stats = queue.get_stats()
+        kept = [queue.dequeue() for _ in range(queue.size())]
+        print(f"  {stats['overflow_policy']:<12} kept {kept}, "
+              f"dropped_oldest={stats['overflow_dropped_oldest']}, "
+              f"dropped_newest={stats['overflow_dropped_newest']}, "
+              f"callbacks={stats['overflow_callbacks']}")
+    print(f"  Callback spilled: {spilled}")
+    
+    # Blocking producer paced by a slower consumer thread - no retry loop
+    queue = SafeQueue(max_size=3, overflow_policy='block', timeout=1.0)
+    received = []
+    
+    def consumer():
+        while len(received) < 10:
+            item = queue.poll()
+            if item is EMPTY:
+                time.sleep(0.001)
+            else:
+                received.append(item)
+    
+    worker = threading.Thread(target=consumer)
+    worker.start()
+    for i in range(10):
+        queue.enqueue(i)
+    worker.join()
+    stats = queue.get_stats()
+    print(f"  block        received {received}, blocked={stats['overflow_blocked']}, "
+          f"timeouts={stats['overflow_block_timeouts']}")
+    
+    queue = SafeQueue(max_size=1, overflow_policy='block', timeout=0.01)
+    queue.enqueue("only")
+    try:
+        queue.enqueue("late")
+    except FullQueueError as e:
+        print(f"  ✓ Timed out: {e}")
+
+
+def safe_queue_scaling_benchmark(sizes=(10_000, 100_000, 1_000_000)):
+    """Show SafeQueue's total cost growing linearly with operation count"""
+    print(f"\n📏 SafeQueue Scaling (n enqueues then n dequeues):")
+    
+    per_op_times = []
+    for n in sizes:
+        queue = SafeQueue(max_size=n)
+        start = time.perf_counter()
+        for i in range(n):
+            queue.enqueue(i)
+        for _ in range(n):
+            queue.dequeue()
+        elapsed = time.perf_counter() - start
+        per_op = elapsed / (2 * n) * 1e9
+        per_op_times.append(per_op)
+        print(f"    n={n:>9,}: {elapsed:.4f}s total, {per_op:.1f} ns/op")
+    
+    # Linear total cost means the per-operation cost stays flat
+    spread = max(per_op_times) / min(per_op_times)
+    print(f"    Per-op cost spread across sizes: {spread:.2f}x "
+          f"({'linear' if spread < 2 else 'super-linear!'})")
+
+
+def bulk_stack_benchmark(num_items=1_000_000):
+    """Compare per-item push/pop with push_many/pop_many and list.extend"""
+    print(f"\n📦 Bulk SafeStack Loading ({num_items:,} items):")
+    items = list(range(num_items))
+    
+    stack = SafeStack(max_size=num_items)
+    start = time.perf_counter()
+    for item in items:
+        stack.push(item)
+    for _ in range(num_items):
+        stack.pop()
+    single_time = time.perf_counter() - start
+    
+    stack = SafeStack(max_size=num_items)
+    start = time.perf_counter()
+    stack.push_many(items)
+    stack.pop_many(num_items)
+    bulk_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    plain = []
+    plain.extend(items)
+    del plain[:]
+    list_time = time.perf_counter() - start
+    
+    print(f"    push/pop one at a time: {single_time:.4f}s")
+    print(f"    push_many/pop_many:     {bulk_time:.4f}s ({single_time/bulk_time:.0f}x faster)")
+    print(f"    list.extend baseline:   {list_time:.4f}s")
+    
+    stack = SafeStack(max_size=3)
+    stack.push("A")
+    try:
+        stack.push_many(["B", "C", "D"])
+    except StackOverflowError as e:
+        print(f"    ✓ All-or-nothing: {e}; size still {stack.size()}")
+
+
+def polling_benchmark(num_polls=100_000, miss_rate=0.9):
+    """Compare exception-based and sentinel-based polling under many misses"""
+    print(f"\n🎣 Polling Styles ({num_polls:,} polls, {miss_rate:.0%} empty):")
+    
+    # Same deterministic pattern of hits and misses for both styles
+    hits = [i % 100 >= miss_rate * 100 for i in range(num_polls)]
+    
+    queue = SafeQueue()
+    start = time.perf_counter()
+    for hit in hits:
+        if hit:
+            queue.enqueue("job")
+        try:
+            queue.dequeue()
+        except EmptyQueueError:
+            pass
+    exception_time = time.perf_counter() - start
+    
+    queue = SafeQueue()
+    start = time.perf_counter()
+    for hit in hits:
+        if hit:
+            queue.offer("job")
+        if queue.poll() is EMPTY:
+            pass
+    sentinel_time = time.perf_counter() - start
+    
+    print(f"    try/except EmptyQueueError: {exception_time:.4f}s")
+    print(f"    poll() with EMPTY sentinel: {sentinel_time:.4f}s")
+    print(f"    Sentinel speedup: {exception_time/sentinel_time:.1f}x")
+
+
+def exception_cost_benchmark(iterations=50_000):
+    """Time raise/catch and rendering for every exception in the hierarchy"""
+    print(f"\n⏱️ Exception Cost ({iterations:,} raises per class, ns each):")
+    
+    full_queue = SafeQueue(max_size=1)
+    full_queue.enqueue("job")
+    full_stack = SafeStack(max_size=1)
+    full_stack.push("plate")
+    payload = {"id": 242, "tags": ["a", "b", "c"]}
+    
+    # Each raiser mirrors how the exception is raised in practice
+    raisers = [
+        (EmptyContainerError, lambda: EmptyContainerError("container", "remove")),
+        (FullContainerError, lambda: FullContainerError("container", 10)),
+        (InvalidIndexError, lambda: InvalidIndexError(12, 10, "list")),
+        (ConfigurationError, lambda: ConfigurationError("max_size", -1, "positive")),
+        (EmptyQueueError, SafeQueue().dequeue),
+        (FullQueueError, lambda: full_queue.enqueue(payload)),
+        (EmptyStackError, SafeStack().pop),
+        (StackOverflowError, lambda: full_stack.push(payload)),
+    ]
+    
+    def best_ns_per_raise(raiser, render, rounds=5):
+        """Best-of-rounds ns per raise/catch, optionally rendering each one"""
+        best = float('inf')
+        for _ in range(rounds):
+            start = time.perf_counter_ns()
+            for _ in range(iterations // rounds):
+                try:
+                    exc = raiser()
+                    if exc is not None:
+                        raise exc
+                except DataStructureError as e:
+                    if render:
+                        str(e)
+                        e.timestamp
+            best = min(best, time.perf_counter_ns() - start)
+        return best / (iterations // rounds)
+    
+    # "rendered" pays everything eager construction used to pay up front
+    print(f"    {'Exception':<22} {'raise/catch':>12} {'rendered':>10} {'saved':>7}")
+    for exc_type, raiser in raisers:
+        lazy_ns = best_ns_per_raise(raiser, render=False)
+        rendered_ns = best_ns_per_raise(raiser, render=True)
+        print(f"    {exc_type.__name__:<22} {lazy_ns:>12.0f} {rendered_ns:>10.0f} "
+              f"{1 - lazy_ns / rendered_ns:>7.0%}")
+
+
+def process_queue_safely(queue, operations):
+    """Process queue operations with proper exception handling"""
+    results = []
+    
+    for operation, *args in operations:
+        try:
+            if operation == "enqueue":
+                queue.enqueue(args[0])
+                results.append(f"✓ Enqueued: {args[0]}")
+            elif operation == "dequeue":
+                item = queue.dequeue()
+                results.append(f"✓ Dequeued: {item}")
+            elif operation == "peek":
+                item = queue.front()
+                results.append(f"✓ Peeked: {item}")
+        
+        except EmptyQueueError as e:
+            results.append(f"⚠ Empty queue error: {e}")
+        except FullQueueError as e:
+            results.append(f"⚠ Full queue error: {e}")
+        except DataStructureError as e:
+            results.append(f"❌ Data structure error: {e}")
+        except Exception as e:
+            results.append(f"💥 Unexpected error: {e}")
+            # In real code, might want to log and re-raise
+    
+    return results
 
 
 def demonstrate_exception_best_practices():
     """Show exception handling best practices"""
     print(f"\n✅ Exception Best Practices:")
     
-    # Specific exception handling
-    def process_queue_safely(queue, operations):
-        """Process queue operations with proper exception handling"""
-        results = []
-        
-        for operation, *args in operations:
-            try:
-                if operation == "enqueue":
-                    queue.enqueue(args[0])
-                    results.append(f"✓ Enqueued: {args[0]}")
-                elif operation == "dequeue":
-                    item = queue.dequeue()
-                    results.append(f"✓ Dequeued: {item}")
-                elif operation == "peek":
-                    item = queue.front()
-                    results.append(f"✓ Peeked: {item}")
-            
-            except EmptyQueueError as e:
-                results.append(f"⚠ Empty queue error: {e}")
-            except FullQueueError as e:
-                results.append(f"⚠ Full queue error: {e}")
-            except DataStructureError as e:
-                results.append(f"❌ Data structure error: {e}")
-            except Exception as e:
-                results.append(f"💥 Unexpected error: {e}")
-                # In real code, might want to log and re-raise
-        
-        return results
-    
     # Test the safe processing
     test_queue = SafeQueue(max_size=2)
     operations = [
@@ -604,6 +1826,42 @@ def demonstrate_exception_best_practices():
     print(f"\n  Safe Queue Processing Results:")
     for result in results:
         print(f"    {result}")
+    
+    # Same batch through the table-driven executor
+    batch = BatchExecutor(SafeQueue(max_size=2)).execute(operations)
+    print(f"\n  BatchExecutor Results: {batch.summary()}")
+    print(f"    Status codes: {list(batch.status)}")
+    for index in batch.failed():
+        print(f"    #{index} {operations[index][0]}: {batch.describe(index)}")
+
+
+def batch_executor_benchmark(num_ops=200_000):
+    """Compare process_queue_safely with BatchExecutor on a bursty batch"""
+    print(f"\n🧮 Batch Execution ({num_ops:,} operations):")
+    
+    # Bursts of enqueues then dequeues, overrunning both ends now and then
+    rng = random.Random(242)
+    operations = []
+    while len(operations) < num_ops:
+        burst = rng.randint(50, 150)
+        operations.extend(("enqueue", i) for i in range(burst))
+        operations.extend([("peek",)] * 5)
+        operations.extend([("dequeue",)] * rng.randint(50, 150))
+    operations = operations[:num_ops]
+    
+    start = time.perf_counter()
+    process_queue_safely(SafeQueue(max_size=128), operations)
+    loop_time = time.perf_counter() - start
+    
+    codes, args = compile_operations(operations)
+    start = time.perf_counter()
+    result = BatchExecutor(SafeQueue(max_size=128)).execute_compiled(codes, args)
+    batch_time = time.perf_counter() - start
+    
+    print(f"    process_queue_safely:      {loop_time:.4f}s")
+    print(f"    BatchExecutor (compiled):  {batch_time:.4f}s "
+          f"({loop_time/batch_time:.1f}x faster)")
+    print(f"    Outcome: {result.summary()}")
 
 
 # ============================================================================
@@ -620,7 +1878,13 @@ def main():
     demonstrate_custom_exceptions()
     demonstrate_exception_hierarchy()
     demonstrate_debugging_features()
+    demonstrate_overflow_policies()
     demonstrate_exception_best_practices()
+    safe_queue_scaling_benchmark()
+    polling_benchmark()
+    bulk_stack_benchmark()
+    batch_executor_benchmark()
+    exception_cost_benchmark()
     
     print(f"\n" + "=" * 60)
     print("✅ All exception handling demonstrations complete!")
@@ -680,7 +680,12 @@ print("=" * 60)
 print("Goal: Analyze and compare container performance characteristics")
 print()
 
+import gc
+import math
+import sys
 import time
+import tracemalloc
+import types
 from collections import deque
 
 class PerformanceAnalyzer:
@@ -740,28 +745,287 @@ class PerformanceAnalyzer:
         # TODO: Perform dequeue operations (pop())
         pass
     
-    def analyze_memory_usage(self, container, num_items=10000):
-        """Analyze memory usage of container"""
-        import sys
+    def analyze_memory_usage(self, container, num_items=10000, item_factory=None,
+                             add=None):
+        """Measure the memory a container adds on top of the items it holds
         
-        # TODO: Measure memory before adding items
-        # TODO: Add items to container
-        # TODO: Measure memory after adding items
-        # TODO: Calculate memory per item
-        pass
+        container is a class or zero-argument factory. Items are created
+        before measuring so only the container's own structure is counted.
+        add(container, item) fills it; by default the add operation is found
+        from OPERATION_NAMES. Two measurements are reported:
+        - tracemalloc: net bytes allocated while building and filling it
+        - deep size: sys.getsizeof summed over every object reachable from
+          the container, excluding the items themselves
+        """
+        item_factory = item_factory or (lambda i: f"item_{i}")
+        items = [item_factory(i) for i in range(num_items)]
+        
+        gc.collect()
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            instance = self._fill_container(container(), items, add)
+            after = tracemalloc.take_snapshot()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+        
+        allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+        deep_size = self._deep_sizeof(instance, exclude={id(item) for item in items})
+        
+        results = {
+            'container': type(instance).__name__,
+            'num_items': num_items,
+            'shallow_bytes': sys.getsizeof(instance),
+            'tracemalloc_bytes': allocated,
+            'deep_bytes': deep_size,
+            'bytes_per_item': deep_size / num_items if num_items else 0.0
+        }
+        self.results[f"memory_{results['container']}"] = results
+        return results
     
-    def test_scaling_behavior(self, container_class, sizes=[100, 500, 1000, 5000]):
-        """Test how performance scales with size"""
-        results = {}
+    def _fill_container(self, container, items, add=None):
+        """Add items with add(container, item); returns the container
         
-        for size in sizes:
-            # TODO: Create container instance
-            # TODO: Time operations for this size
-            # TODO: Store timing results
-            pass
+        Persistent containers return a new version from each add, so the
+        newest version is kept.
+        """
+        if add is None:
+            for names in self.OPERATION_NAMES:
+                if hasattr(container, names['add']):
+                    add_name = names['add']
+                    add = lambda container, item: getattr(container, add_name)(item)
+                    break
+            else:
+                raise TypeError(f"Cannot find an add operation on {type(container).__name__}")
+        
+        for item in items:
+            result = add(container, item)
+            if isinstance(result, type(container)):
+                container = result
+        return container
+    
+    @staticmethod
+    def _deep_sizeof(root, exclude=()):
+        """Sum sys.getsizeof over all objects reachable from root
         
+        Classes, modules and code objects are shared by every instance, so
+        they are not charged to the container; neither are ids in exclude.
+        Functions are charged but only their closures are followed, since
+        their globals belong to the module.
+        """
+        shared = (type, types.ModuleType, types.BuiltinFunctionType, types.CodeType)
+        seen = set(exclude)
+        stack = [root]
+        total = 0
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen or isinstance(obj, shared):
+                continue
+            seen.add(id(obj))
+            total += sys.getsizeof(obj)
+            if isinstance(obj, types.FunctionType):
+                stack.extend(cell.cell_contents for cell in obj.__closure__ or ())
+            else:
+                stack.extend(gc.get_referents(obj))
+        return total
+    
+    def compare_memory_usage(self, num_items=10000):
+        """Report per-item memory and overhead against a plain list
+        
+        Covers every container in advanced_containers.py and
+        custom_exceptions.py; the ratio is deep bytes relative to a list
+        holding the same items. Containers whose add operation does not take
+        a single item are listed in ADD_ADAPTERS.
+        """
+        import advanced_containers as ac
+        import custom_exceptions as ce
+        
+        containers = {
+            'list': list,
+            'collections.deque': deque,
+            'ListQueue': ac.ListQueue,
+            'ReverseListQueue': ac.ReverseListQueue,
+            'TwoStackQueue': ac.TwoStackQueue,
+            'CircularQueue': lambda: ac.CircularQueue(num_items),
+            'Deque': ac.Deque,
+            'Deque (indexed)': lambda: ac.Deque(indexed=True),
+            'PriorityQueue': ac.PriorityQueue,
+            'IndexedPriorityQueue': ac.IndexedPriorityQueue,
+            'MonitoredStack': ac.MonitoredStack,
+            'MinMaxStack': ac.MinMaxStack,
+            'PersistentQueue': ac.PersistentQueue,
+            'PersistentStack': ac.PersistentStack,
+            'SafeQueue': ce.SafeQueue,
+            'SafeStack': ce.SafeStack,
+            'DebuggingQueue': ce.DebuggingQueue,
+        }
+        
+        report = {}
+        for name, factory in containers.items():
+            report[name] = self.analyze_memory_usage(
+                factory, num_items, add=self.ADD_ADAPTERS.get(name))
+        
+        list_bytes = report['list']['deep_bytes']
+        for results in report.values():
+            results['overhead_vs_list'] = results['deep_bytes'] / list_bytes
+        self.results['memory_comparison'] = report
+        return report
+    
+    # name -> add(container, item) for containers without a one-argument add
+    ADD_ADAPTERS = {
+        'PriorityQueue': lambda queue, item: queue.enqueue(item, 0),
+        'IndexedPriorityQueue': lambda queue, item: queue.enqueue(item, 0),
+    }
+    
+    # Operation names tried in order when detecting a container's interface
+    OPERATION_NAMES = [
+        {'add': 'enqueue', 'remove': 'dequeue', 'peek': 'front'},
+        {'add': 'push', 'remove': 'pop', 'peek': 'peek'},
+        {'add': 'append', 'remove': 'popleft'},
+    ]
+    
+    # Candidate per-operation cost models, simplest first
+    COMPLEXITY_MODELS = [
+        ('O(1)', lambda n: 1.0),
+        ('O(log n)', lambda n: math.log2(n)),
+        ('O(n)', lambda n: float(n)),
+        ('O(n log n)', lambda n: n * math.log2(n)),
+    ]
+    # A more complex model must leave at most this fraction of the residual
+    COMPLEXITY_MARGIN = 0.25
+    
+    def test_scaling_behavior(self, container_class, sizes=None, min_size=256,
+                              max_size=32768, factor=2, repeats=5,
+                              operations=None, expected='O(1)'):
+        """Measure per-operation cost across sizes and fit complexity models
+        
+        Sizes sweep geometrically from min_size to max_size unless given.
+        At each size n the container is filled to n, then n adds (n -> 2n),
+        n removes (2n -> n) and n peeks are timed separately, so amortized
+        operations such as TwoStackQueue.dequeue are charged fairly. The
+        fastest per-operation time over repeats (the one least disturbed by
+        the rest of the system) is fitted to each model, and any operation
+        whose best fit is worse than expected is flagged. Each size gets one
+        untimed warm-up pass first, so allocator and cache growth are not
+        charged to the first timed repeat.
+        """
+        if sizes is None:
+            sizes = []
+            size = min_size
+            while size <= max_size:
+                sizes.append(size)
+                size *= factor
+        
+        probe = container_class()
+        if operations is None:
+            for names in self.OPERATION_NAMES:
+                if hasattr(probe, names['add']) and hasattr(probe, names['remove']):
+                    operations = {kind: name for kind, name in names.items()
+                                  if hasattr(probe, name)}
+                    break
+            else:
+                raise TypeError(f"Cannot find queue/stack operations on {container_class.__name__}")
+        
+        timings = {kind: [] for kind in operations}
+        for n in sizes:
+            samples = {kind: [] for kind in operations}
+            for _ in range(repeats + 1):  # First pass is an untimed warm-up
+                container = container_class()
+                add = getattr(container, operations['add'])
+                remove = getattr(container, operations['remove'])
+                for i in range(n):
+                    add(i)
+                
+                start = time.perf_counter_ns()
+                for i in range(n):
+                    add(i)
+                samples['add'].append((time.perf_counter_ns() - start) / n)
+                
+                start = time.perf_counter_ns()
+                for _ in range(n):
+                    remove()
+                samples['remove'].append((time.perf_counter_ns() - start) / n)
+                
+                if 'peek' in operations:
+                    peek = getattr(container, operations['peek'])
+                    start = time.perf_counter_ns()
+                    for _ in range(n):
+                        peek()
+                    samples['peek'].append((time.perf_counter_ns() - start) / n)
+            
+            for kind in operations:
+                timings[kind].append(min(samples[kind][1:]))
+        
+        model_names = [name for name, _ in self.COMPLEXITY_MODELS]
+        complexity = {}
+        for kind, per_op in timings.items():
+            fit = self._fit_complexity(sizes, per_op)
+            fit['operation'] = operations[kind]
+            fit['flagged'] = model_names.index(fit['best_fit']) > model_names.index(expected)
+            complexity[kind] = fit
+        
+        results = {
+            'container': container_class.__name__,
+            'sizes': sizes,
+            'ns_per_op': timings,
+            'complexity': complexity
+        }
+        self.results[f"scaling_{container_class.__name__}"] = results
         return results
     
+    def _fit_complexity(self, sizes, per_op):
+        """Fit t(n) = a + b*f(n) (a, b >= 0) for each model and pick one
+        
+        Models are tried simplest first. A more complex model only replaces
+        the current choice when it cuts the residual error by COMPLEXITY_MARGIN
+        and its fitted cost grows by 1.5x or more across the sweep. Adjacent
+        models such as O(n) and O(n log n) fit noisy data almost equally
+        well, so the margin is deliberately wide. The measured
+        times must also grow: the median of the larger half of the sizes has
+        to be 1.25x the median of the smaller half. Together these keep a
+        single noisy point or cache effects from promoting an O(1) operation.
+        """
+        fits = {}
+        for name, model in self.COMPLEXITY_MODELS:
+            xs = [model(n) for n in sizes]
+            a, b = self._nonnegative_line_fit(xs, per_op)
+            rss = sum((a + b * x - t) ** 2 for x, t in zip(xs, per_op))
+            growth = (a + b * xs[-1]) / (a + b * xs[0]) if a + b * xs[0] > 0 else 1.0
+            fits[name] = {'intercept_ns': a, 'slope_ns': b, 'rss': rss, 'growth': growth}
+        
+        half = len(per_op) // 2
+        small, large = sorted(per_op[:half]), sorted(per_op[half:])
+        measured_growth = large[len(large) // 2] / small[len(small) // 2] if half else 1.0
+        
+        best = 'O(1)'
+        if measured_growth < 1.25:
+            return {'best_fit': best, 'fits': fits}
+        for name, _ in self.COMPLEXITY_MODELS[1:]:
+            if (fits[name]['rss'] < self.COMPLEXITY_MARGIN * fits[best]['rss']
+                    and fits[name]['growth'] >= 1.5):
+                best = name
+        return {'best_fit': best, 'fits': fits}
+    
+    @staticmethod
+    def _nonnegative_line_fit(xs, ys):
+        """Least-squares a + b*x with a, b clamped to be non-negative"""
+        n = len(xs)
+        mean_x = sum(xs) / n
+        mean_y = sum(ys) / n
+        var_x = sum((x - mean_x) ** 2 for x in xs)
+        if var_x == 0:
+            return mean_y, 0.0
+        b = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+        a = mean_y - b * mean_x
+        if b < 0:
+            return mean_y, 0.0
+        if a < 0:
+            return 0.0, sum(x * y for x, y in zip(xs, ys)) / sum(x * x for x in xs)
+        return a, b
+    
     def generate_report(self):
         """Generate performance analysis report"""
         # TODO: Create formatted report of all test results
@@ -860,10 +1124,22 @@ def run_performance_tests():
         
         # Test scaling behavior
         print("  📈 Testing Scaling Behavior:")
-        scaling_results = analyzer.test_scaling_behavior(CustomQueue)
+        from advanced_containers import ListQueue, TwoStackQueue
+        for container_class in [CustomQueue, ListQueue, TwoStackQueue]:
+            scaling_results = analyzer.test_scaling_behavior(container_class)
+            print(f"    {scaling_results['container']} "
+                  f"(sizes {scaling_results['sizes'][0]}..{scaling_results['sizes'][-1]}):")
+            for kind, fit in scaling_results['complexity'].items():
+                flag = "  ⚠ slower than expected" if fit['flagged'] else ""
+                print(f"      {fit['operation']}: {fit['best_fit']}{flag}")
         
-        for size, time_taken in scaling_results.items():
-            print(f"    Size {size}: {time_taken:.4f} seconds")
+        # Memory usage against a plain list
+        print("  💾 Memory Usage (10000 items):")
+        memory_report = analyzer.compare_memory_usage(10000)
+        for name, usage in memory_report.items():
+            print(f"    {name:<22} {usage['bytes_per_item']:6.1f} bytes/item "
+                  f"({usage['overhead_vs_list']:.2f}x list, "
+                  f"tracemalloc {usage['tracemalloc_bytes']:,} bytes)")
         
         print("✅ Performance tests completed!")
         
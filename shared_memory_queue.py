@@ -0,0 +1,367 @@
+"""
+Shared Memory Queue - Week 3
+CSC 242 - Object-Oriented Programming
+
+This file demonstrates a cross-process ring buffer:
+- CircularQueue API and capacity semantics in shared memory
+- Fixed-size records or length-prefixed byte payloads
+- No pickling: producers write bytes straight into the ring
+- Zero-copy reads through a borrowed memoryview
+- Attaching to an existing ring by name from another process
+
+Author: CSC 242 Teaching Team
+"""
+
+import os
+import struct
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+
+
+# ============================================================================
+# SHARED MEMORY LAYOUT
+# ============================================================================
+
+print("🔗 SHARED MEMORY RING BUFFER")
+print("=" * 60)
+
+# Header: capacity, slot_size, mode. The front and rear counters sit on
+# their own cache lines so the producer and consumer do not false-share.
+_HEADER = struct.Struct('<QQQ')
+_INDEX = struct.Struct('<Q')
+_LENGTH = struct.Struct('<I')
+_FRONT_OFFSET = 64
+_REAR_OFFSET = 128
+_DATA_OFFSET = 192
+
+_MODES = {'fixed': 0, 'bytes': 1}
+_MODE_NAMES = {code: name for name, code in _MODES.items()}
+
+
+class SharedRingQueue:
+    """CircularQueue-style ring buffer living in multiprocessing.shared_memory
+
+    In 'fixed' mode every record is exactly slot_size bytes. In 'bytes' mode
+    each slot holds a 4-byte length prefix followed by a payload of up to
+    slot_size bytes. The front/rear counters only ever grow, so one producer
+    and one consumer need no lock; pass a multiprocessing.Lock when several
+    processes share either end.
+
+    The lock-free case publishes a counter with a plain store after writing
+    the slot, with no memory barrier. That is only safe where stores become
+    visible to other processes in program order: x86/x86-64 (total store
+    order) running CPython. On weakly ordered CPUs such as ARM, always pass
+    a lock, whose acquire/release supplies the ordering.
+    """
+
+    def __init__(self, capacity, slot_size, mode='bytes', name=None, lock=None):
+        """Create a new ring with capacity slots of slot_size bytes"""
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if slot_size <= 0:
+            raise ValueError("slot_size must be positive")
+        if mode not in _MODES:
+            raise ValueError(f"mode must be one of {sorted(_MODES)}")
+
+        stride = slot_size + (_LENGTH.size if mode == 'bytes' else 0)
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=_DATA_OFFSET + capacity * stride)
+        _HEADER.pack_into(self._shm.buf, 0, capacity, slot_size, _MODES[mode])
+        _INDEX.pack_into(self._shm.buf, _FRONT_OFFSET, 0)
+        _INDEX.pack_into(self._shm.buf, _REAR_OFFSET, 0)
+        self._setup(lock, owner=True)
+
+    @classmethod
+    def attach(cls, name, lock=None, shared_tracker=False):
+        """Attach to a ring created by another process
+        
+        Only the creator owns the segment. Python's resource tracker would
+        otherwise unlink it when an attaching process exits, so attach()
+        stops this process's tracker from tracking it. Pass
+        shared_tracker=True when attaching from the creating process or one
+        of its multiprocessing children: they share the creator's tracker,
+        which must keep tracking the segment.
+        """
+        ring = cls.__new__(cls)
+        if sys.version_info >= (3, 13):
+            ring._shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            ring._shm = shared_memory.SharedMemory(name=name)
+            if not shared_tracker and os.name == 'posix':
+                # The tracker keys POSIX segments by their "/"-prefixed name,
+                # while SharedMemory.name reports it without the slash
+                resource_tracker.unregister("/" + ring._shm.name, "shared_memory")
+        ring._setup(lock, owner=False)
+        return ring
+
+    def _setup(self, lock, owner):
+        """Read the layout from the header and cache it locally"""
+        capacity, slot_size, mode = _HEADER.unpack_from(self._shm.buf, 0)
+        self._capacity = capacity
+        self._slot_size = slot_size
+        self._mode = _MODE_NAMES[mode]
+        self._stride = slot_size + (_LENGTH.size if self._mode == 'bytes' else 0)
+        self._buf = self._shm.buf
+        self._lock = lock
+        self._owner = owner
+
+    # Index helpers -------------------------------------------------------
+
+    def _load(self, offset):
+        return _INDEX.unpack_from(self._buf, offset)[0]
+
+    def _slot_offset(self, counter):
+        return _DATA_OFFSET + (counter % self._capacity) * self._stride
+
+    def _payload_bounds(self, counter):
+        """Return (start, end) of the payload stored for counter"""
+        offset = self._slot_offset(counter)
+        if self._mode == 'fixed':
+            return offset, offset + self._slot_size
+        length = _LENGTH.unpack_from(self._buf, offset)[0]
+        start = offset + _LENGTH.size
+        return start, start + length
+
+    # Queue operations ----------------------------------------------------
+
+    def enqueue(self, payload):
+        """Copy payload into the rear slot (O(1), one copy)"""
+        payload = memoryview(payload).cast('B')
+        if self._mode == 'fixed' and len(payload) != self._slot_size:
+            raise ValueError(f"Record must be exactly {self._slot_size} bytes")
+        if len(payload) > self._slot_size:
+            raise ValueError(f"Payload exceeds slot size ({self._slot_size} bytes)")
+
+        if self._lock:
+            with self._lock:
+                self._enqueue(payload)
+        else:
+            self._enqueue(payload)
+
+    def _enqueue(self, payload):
+        rear = self._load(_REAR_OFFSET)
+        if rear - self._load(_FRONT_OFFSET) >= self._capacity:
+            raise OverflowError(f"Queue is full (capacity: {self._capacity})")
+
+        offset = self._slot_offset(rear)
+        if self._mode == 'bytes':
+            _LENGTH.pack_into(self._buf, offset, len(payload))
+            offset += _LENGTH.size
+        self._buf[offset:offset + len(payload)] = payload
+        # Publish only after the payload is written (ordered on x86 only;
+        # see the class docstring)
+        _INDEX.pack_into(self._buf, _REAR_OFFSET, rear + 1)
+
+    def dequeue(self):
+        """Remove the front payload and return it as bytes (O(1))"""
+        with self.consume() as view:
+            return bytes(view)
+
+    @contextmanager
+    def consume(self):
+        """Borrow the front payload as a memoryview, then release its slot
+
+        The view is only valid inside the with block; the slot is handed back
+        to producers when the block exits.
+        """
+        if self._lock:
+            self._lock.acquire()
+        try:
+            front = self._load(_FRONT_OFFSET)
+            if front == self._load(_REAR_OFFSET):
+                raise IndexError("dequeue from empty queue")
+
+            start, end = self._payload_bounds(front)
+            view = self._buf[start:end]
+            try:
+                yield view
+            finally:
+                view.release()
+            _INDEX.pack_into(self._buf, _FRONT_OFFSET, front + 1)
+        finally:
+            if self._lock:
+                self._lock.release()
+
+    def front(self):
+        """Peek at front payload (copied to bytes)"""
+        front = self._load(_FRONT_OFFSET)
+        if front == self._load(_REAR_OFFSET):
+            raise IndexError("front of empty queue")
+        start, end = self._payload_bounds(front)
+        return bytes(self._buf[start:end])
+
+    def is_empty(self):
+        return self.size() == 0
+
+    def is_full(self):
+        return self.size() >= self._capacity
+
+    def size(self):
+        return self._load(_REAR_OFFSET) - self._load(_FRONT_OFFSET)
+
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def get_stats(self):
+        """Return performance statistics (counters are shared by all processes)"""
+        front = self._load(_FRONT_OFFSET)
+        rear = self._load(_REAR_OFFSET)
+        size = rear - front
+        return {
+            'type': 'SharedRingQueue',
+            'name': self._shm.name,
+            'mode': self._mode,
+            'slot_size': self._slot_size,
+            'size': size,
+            'capacity': self._capacity,
+            'utilization': f"{(size/self._capacity)*100:.1f}%",
+            'enqueue_count': rear,
+            'dequeue_count': front,
+            'efficiency': 'O(1) both operations, no pickling'
+        }
+
+    def to_list(self):
+        """Copy payloads to a list in logical order"""
+        return list(self)
+
+    def __iter__(self):
+        """Iterate payloads (as bytes) from front to rear without removing"""
+        front = self._load(_FRONT_OFFSET)
+        rear = self._load(_REAR_OFFSET)
+        for counter in range(front, rear):
+            start, end = self._payload_bounds(counter)
+            yield bytes(self._buf[start:end])
+
+    def __len__(self):
+        return self.size()
+
+    # Lifetime ------------------------------------------------------------
+
+    def close(self):
+        """Detach this process from the shared memory block"""
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self):
+        """Free the shared memory block (call once, from the creator)"""
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __str__(self):
+        return (f"SharedRingQueue(name={self._shm.name}, size={self.size()}, "
+                f"capacity={self._capacity}, mode={self._mode})")
+
+
+# ============================================================================
+# DEMONSTRATION FUNCTIONS
+# ============================================================================
+
+def _producer(name, count):
+    """Producer process: attach by name and enqueue raw byte payloads"""
+    ring = SharedRingQueue.attach(name)
+    try:
+        for i in range(count):
+            payload = f"reading-{i}".encode()
+            while True:
+                try:
+                    ring.enqueue(payload)
+                    break
+                except OverflowError:
+                    time.sleep(0)  # Ring full - let the consumer catch up
+    finally:
+        ring.close()
+
+
+def demonstrate_cross_process_ring(timeout=10.0):
+    """Move byte payloads between processes without pickling"""
+    print(f"\n🔁 Cross-process byte payloads:")
+
+    count = 20
+    with SharedRingQueue(capacity=4, slot_size=32, mode='bytes') as ring:
+        # An independent interpreter, not a fork: it only knows the name
+        code = (f"import sys; sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r}); "
+                f"import shared_memory_queue; "
+                f"shared_memory_queue._producer({ring.name!r}, {count})")
+        worker = subprocess.Popen([sys.executable, "-c", code],
+                                  stdout=subprocess.DEVNULL)
+
+        received = []
+        deadline = time.monotonic() + timeout
+        while len(received) < count:
+            try:
+                with ring.consume() as view:
+                    received.append(bytes(view).decode())
+            except IndexError:
+                if worker.poll() is not None and ring.is_empty():
+                    break  # Producer exited (or died) with nothing left to read
+                if time.monotonic() > deadline:
+                    worker.kill()
+                    break
+                time.sleep(0)
+
+        worker.wait()
+        if len(received) < count:
+            print(f"    ⚠ Producer stopped early (exit code {worker.returncode}): "
+                  f"received {len(received)} of {count}")
+            return
+        print(f"    First/last received: {received[0]} ... {received[-1]}")
+        print(f"    Stats: {ring.get_stats()}")
+
+
+def demonstrate_fixed_records():
+    """Pack fixed-size records with struct"""
+    print(f"\n📐 Fixed-size records:")
+
+    record = struct.Struct('<Id')  # sensor id, value
+    with SharedRingQueue(capacity=3, slot_size=record.size, mode='fixed') as ring:
+        for sensor_id, value in [(1, 20.5), (2, 19.75), (3, 21.0)]:
+            ring.enqueue(record.pack(sensor_id, value))
+        print(f"    {ring}")
+
+        try:
+            ring.enqueue(record.pack(4, 0.0))
+        except OverflowError as e:
+            print(f"    Error: {e}")
+
+        while not ring.is_empty():
+            with ring.consume() as view:
+                print(f"    Record: {record.unpack(view)}")
+
+
+# ============================================================================
+# MAIN DEMONSTRATION FUNCTION
+# ============================================================================
+
+def main():
+    """Run all shared memory queue demonstrations"""
+    print("🔗 SHARED MEMORY QUEUE - CSC 242 Week 3")
+    print("=" * 60)
+
+    demonstrate_fixed_records()
+    demonstrate_cross_process_ring()
+
+    print(f"\n" + "=" * 60)
+    print("✅ All shared memory demonstrations complete!")
+
+    print(f"\n💡 Key Shared Memory Concepts:")
+    print(f"   1. Same capacity semantics as CircularQueue")
+    print(f"   2. Monotonic counters make one-producer/one-consumer lock-free")
+    print(f"   3. Bytes in, bytes out - nothing is pickled")
+
+
+if __name__ == "__main__":
+    main()
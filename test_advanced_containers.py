@@ -0,0 +1,36 @@
+"""
+Tests for advanced_containers.py
+
+Run with: python -m pytest -q
+"""
+
+import pytest
+
+from advanced_containers import MinMaxStack
+
+
+def test_min_max_follow_push_and_pop():
+    stack = MinMaxStack()
+    for item in [5, 3, 8, 3, 9]:
+        stack.push(item)
+    assert (stack.min(), stack.max()) == (3, 9)
+
+    stack.pop()
+    stack.pop()
+    assert (stack.min(), stack.max()) == (3, 8)
+
+
+def test_incomparable_push_leaves_stack_unchanged():
+    stack = MinMaxStack()
+    stack.push(1)
+
+    with pytest.raises(TypeError):
+        stack.push("a")
+
+    assert stack.size() == 1
+    assert list(stack) == [1]
+    assert (stack.min(), stack.max()) == (1, 1)
+    assert stack.get_stats()['operations']['push_count'] == 1
+
+    stack.push(0)
+    assert (stack.min(), stack.max()) == (0, 1)
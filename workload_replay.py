@@ -0,0 +1,419 @@
+"""
+Workload Replay - Week 3
+CSC 242 - Object-Oriented Programming
+
+This file captures real operation streams and replays them:
+- A recorder that attaches to any queue or stack and logs add/remove/peek
+- Compact binary trace files (op code + nanosecond offset per operation)
+- Replay against any container at full speed or in real time
+- Throughput and per-operation latency histograms for each replay
+- Picking an implementation from actual traffic, not synthetic loops
+
+Usage:
+    python workload_replay.py                                  # demo
+    python workload_replay.py --trace prod.wkld --mode realtime
+
+Author: CSC 242 Teaching Team
+"""
+
+import argparse
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+from array import array
+
+from advanced_containers import (
+    CircularQueue, Deque, IndexedPriorityQueue, LatencyHistogram, ListQueue,
+    MinMaxStack, MonitoredStack, PriorityQueue, ReverseListQueue, TwoStackQueue
+)
+from custom_exceptions import DataStructureError, DebuggingQueue, SafeQueue, SafeStack
+
+
+# ============================================================================
+# WORKLOAD TRACES
+# ============================================================================
+
+print("🎬 WORKLOAD CAPTURE AND REPLAY")
+print("=" * 60)
+
+# Operation kinds; FAILED is or-ed in when the operation raised (e.g. empty)
+ADD, REMOVE, PEEK = 1, 2, 3
+FAILED = 0x80
+KIND_NAMES = {ADD: 'add', REMOVE: 'remove', PEEK: 'peek'}
+
+# Method names recognised for each kind, in order of preference
+KIND_METHODS = {
+    ADD: ('enqueue', 'push', 'add_rear'),
+    REMOVE: ('dequeue', 'pop', 'remove_front'),
+    PEEK: ('front', 'peek'),
+}
+
+# Errors that mean "the container refused" rather than "the replay is broken"
+_REFUSALS = (IndexError, OverflowError, DataStructureError)
+
+# File layout: header (magic, version, count), ops column, offsets column
+_MAGIC = b'WKLD'
+_HEADER = struct.Struct('<4sBxxxQ')
+
+
+class Workload:
+    """An operation stream: one op byte and one ns offset per operation
+
+    Item values are not captured, which keeps traces small and free of
+    production data; replays feed sequential integers instead.
+    """
+
+    def __init__(self, ops=None, offsets_ns=None):
+        """Wrap existing columns (typed arrays) or start empty"""
+        self.ops = ops if ops is not None else array('B')
+        self.offsets_ns = offsets_ns if offsets_ns is not None else array('Q')
+        if len(self.ops) != len(self.offsets_ns):
+            raise ValueError("ops and offsets_ns must be the same length")
+
+    def __len__(self):
+        return len(self.ops)
+
+    def duration_ns(self):
+        """Time from the first to the last recorded operation"""
+        return self.offsets_ns[-1] - self.offsets_ns[0] if self.ops else 0
+
+    def peak_size(self):
+        """Largest size the container reached while recording"""
+        size = peak = 0
+        for op in self.ops:
+            if op == ADD:
+                size += 1
+                peak = max(peak, size)
+            elif op == REMOVE:
+                size -= 1
+        return peak
+
+    def summary(self):
+        """Counts per kind, failures and recorded duration"""
+        counts = {name: 0 for name in KIND_NAMES.values()}
+        failures = 0
+        for op in self.ops:
+            counts[KIND_NAMES[op & ~FAILED]] += 1
+            failures += bool(op & FAILED)
+        return {
+            'operations': len(self),
+            **counts,
+            'failed': failures,
+            'duration_s': self.duration_ns() / 1e9,
+            'peak_size': self.peak_size()
+        }
+
+    def save(self, path):
+        """Write the trace to path (little-endian)"""
+        offsets = self.offsets_ns
+        if sys.byteorder != 'little':
+            offsets = array('Q', offsets)
+            offsets.byteswap()
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, 1, len(self)))
+            self.ops.tofile(f)
+            offsets.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Read a trace written by save()"""
+        with open(path, 'rb') as f:
+            magic, version, count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or version != 1:
+                raise ValueError(f"{path} is not a workload trace")
+            ops = array('B')
+            ops.fromfile(f, count)
+            offsets = array('Q')
+            offsets.fromfile(f, count)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        return cls(ops, offsets)
+
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+class WorkloadRecorder:
+    """Recording proxy for a live queue or stack
+
+    Use the recorder in place of the container: calls to its add/remove/
+    peek methods (every alias, e.g. Deque.enqueue and Deque.add_rear) are
+    logged and forwarded, and any other attribute is read from the
+    container. The container itself is never modified, so calls made on it
+    directly, including the ones its own methods make internally, are not
+    recorded and each operation is logged once. stop() ends recording; the
+    recorder keeps forwarding afterwards.
+    """
+
+    def __init__(self, container):
+        """Wrap container (recording starts immediately)"""
+        self.container = container
+        self.workload = Workload()
+        self._start_ns = time.perf_counter_ns()
+        self._recorded = []
+
+        for kind, names in KIND_METHODS.items():
+            for name in names:
+                if callable(getattr(container, name, None)):
+                    setattr(self, name, self._record(getattr(container, name), kind))
+                    self._recorded.append(name)
+
+    def _record(self, operation, kind):
+        """Return a wrapper around operation that appends a record"""
+        ops = self.workload.ops
+        offsets = self.workload.offsets_ns
+        start_ns = self._start_ns
+        clock = time.perf_counter_ns
+
+        def recorded(*args, **kwargs):
+            offset = clock() - start_ns
+            try:
+                result = operation(*args, **kwargs)
+            except _REFUSALS:
+                ops.append(kind | FAILED)
+                offsets.append(offset)
+                raise
+            ops.append(kind)
+            offsets.append(offset)
+            return result
+        return recorded
+
+    def __getattr__(self, name):
+        """Forward everything that is not recorded to the container"""
+        return getattr(self.container, name)
+
+    def __len__(self):
+        return len(self.container)
+
+    def __iter__(self):
+        return iter(self.container)
+
+    def stop(self):
+        """Stop recording and return the captured Workload"""
+        for name in self._recorded:
+            del self.__dict__[name]  # Later calls reach the container via __getattr__
+        self._recorded = []
+        return self.workload
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+# ============================================================================
+# REPLAY
+# ============================================================================
+
+# Real-time replay sleeps until this close to an operation, then spins
+_SPIN_NS = 200_000
+
+# name -> factory(capacity); capacity is the trace's peak size
+REPLAY_CONTAINERS = {
+    'ListQueue': lambda capacity: ListQueue(),
+    'ReverseListQueue': lambda capacity: ReverseListQueue(),
+    'TwoStackQueue': lambda capacity: TwoStackQueue(),
+    'CircularQueue': lambda capacity: CircularQueue(max(capacity, 1)),
+    'Deque': lambda capacity: Deque(),
+    'PriorityQueue': lambda capacity: PriorityQueue(),
+    'IndexedPriorityQueue': lambda capacity: IndexedPriorityQueue(),
+    'MonitoredStack': lambda capacity: MonitoredStack(),
+    'MinMaxStack': lambda capacity: MinMaxStack(),
+    'SafeQueue': lambda capacity: SafeQueue(),
+    'SafeStack': lambda capacity: SafeStack(),
+    'DebuggingQueue': lambda capacity: DebuggingQueue(),
+}
+
+
+def _bind(container):
+    """Return {kind: callable} for the container's add/remove/peek methods"""
+    bound = {}
+    for kind, names in KIND_METHODS.items():
+        for name in names:
+            method = getattr(container, name, None)
+            if callable(method):
+                bound[kind] = method
+                break
+    if ADD not in bound or REMOVE not in bound:
+        raise TypeError(f"{type(container).__name__} has no recognised add/remove methods")
+
+    if isinstance(container, (PriorityQueue, IndexedPriorityQueue)):
+        enqueue = bound[ADD]
+        bound[ADD] = lambda item: enqueue(item, item)  # Arrival order as priority
+    return bound
+
+
+def replay(workload, container, mode='full', speed=1.0):
+    """Drive container with workload and report throughput and latency
+
+    mode='full' issues operations back to back. mode='realtime' waits until
+    each operation's recorded offset (divided by speed) and also reports how
+    far the replay fell behind schedule. Operations that failed when
+    recorded (e.g. polls of an empty queue) are replayed for their cost and
+    expected to fail again; 'refused' only counts operations that succeeded
+    in the recording but were refused by this container.
+    """
+    if mode not in ('full', 'realtime'):
+        raise ValueError("mode must be 'full' or 'realtime'")
+    if speed <= 0:
+        raise ValueError("speed must be positive")
+
+    bound = _bind(container)
+    histograms = {kind: LatencyHistogram() for kind in bound}
+    lag = LatencyHistogram()
+    refused = 0
+    item = 0
+    realtime = mode == 'realtime'
+    clock = time.perf_counter_ns
+    first_offset = workload.offsets_ns[0] if len(workload) else 0
+
+    replay_start = clock()
+    for op, offset in zip(workload.ops, workload.offsets_ns):
+        kind = op & ~FAILED
+        if realtime:
+            due = replay_start + (offset - first_offset) / speed
+            delay = due - clock()
+            if delay > _SPIN_NS:
+                time.sleep((delay - _SPIN_NS) / 1e9)
+            while clock() < due:
+                pass  # sleep() is too coarse for the last stretch
+            lag.record(clock() - due)
+
+        operation = bound.get(kind)
+        if operation is None:
+            continue  # e.g. a peek against a container without one
+        start = clock()
+        try:
+            if kind == ADD:
+                operation(item)
+                item += 1
+            else:
+                operation()
+        except _REFUSALS:
+            if not op & FAILED:
+                refused += 1
+        histograms[kind].record(clock() - start)
+    elapsed_ns = clock() - replay_start
+
+    report = {
+        'container': type(container).__name__,
+        'mode': mode,
+        'speed': speed,
+        'operations': len(workload),
+        'refused': refused,
+        'elapsed_s': elapsed_ns / 1e9,
+        'throughput_ops_per_s': len(workload) / (elapsed_ns / 1e9) if elapsed_ns else 0.0,
+        'latency': {KIND_NAMES[kind]: histogram.summary()
+                    for kind, histogram in histograms.items() if histogram.count()}
+    }
+    if realtime:
+        report['schedule_lag'] = lag.summary()
+    return report
+
+
+def compare_implementations(workload, names=None, mode='full', speed=1.0):
+    """Replay workload on fresh containers and rank them by throughput"""
+    capacity = workload.peak_size()
+    reports = [replay(workload, REPLAY_CONTAINERS[name](capacity), mode, speed)
+               for name in (names or REPLAY_CONTAINERS)]
+    return sorted(reports, key=lambda report: -report['throughput_ops_per_s'])
+
+
+def format_report(report):
+    """One-line human-readable summary of a replay"""
+    latency = report['latency']
+    add_p99 = latency.get('add', {}).get('p99_ns', 0)
+    remove_p99 = latency.get('remove', {}).get('p99_ns', 0)
+    return (f"{report['container']:<22} {report['throughput_ops_per_s']:>12,.0f} ops/s  "
+            f"p99 add {add_p99:>6,} ns  p99 remove {remove_p99:>6,} ns  "
+            f"refused {report['refused']}")
+
+
+# ============================================================================
+# DEMONSTRATION FUNCTIONS
+# ============================================================================
+
+def record_demo_traffic(bursts=40, seed=242):
+    """Record bursty producer/consumer traffic on a live SafeQueue"""
+    rng = random.Random(seed)
+    with WorkloadRecorder(SafeQueue()) as queue:
+        for _ in range(bursts):
+            for i in range(rng.randint(20, 200)):   # Producer burst
+                queue.enqueue(i)
+            while not queue.is_empty():             # Consumer drains
+                queue.front()
+                queue.dequeue()
+            try:
+                queue.dequeue()                     # Idle poll on empty queue
+            except DataStructureError:
+                pass
+            time.sleep(0.001 + rng.random() / 500)  # Gap between bursts
+    return queue.workload
+
+
+def demonstrate_capture_and_replay():
+    """Record traffic, round-trip it through a file, and replay it"""
+    print(f"\n🎙️ Capturing traffic:")
+    workload = record_demo_traffic()
+    print(f"    {workload.summary()}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "demo.wkld")
+        workload.save(path)
+        print(f"    Saved {len(workload):,} operations in {os.path.getsize(path):,} bytes")
+        workload = Workload.load(path)
+
+    print(f"\n⚡ Full-speed replay, ranked by throughput:")
+    for report in compare_implementations(workload):
+        print(f"    {format_report(report)}")
+
+    print(f"\n⏱️ Real-time replay on Deque:")
+    report = replay(workload, Deque(), mode='realtime')
+    print(f"    {format_report(report)}")
+    print(f"    Elapsed {report['elapsed_s']:.3f}s for {workload.duration_ns()/1e9:.3f}s "
+          f"of recorded traffic; schedule lag p99 {report['schedule_lag']['p99_ns']:,} ns")
+
+
+# ============================================================================
+# MAIN DEMONSTRATION FUNCTION
+# ============================================================================
+
+def main(argv=None):
+    """Replay a saved trace, or run the demonstration when none is given"""
+    parser = argparse.ArgumentParser(description="Replay a recorded container workload")
+    parser.add_argument('--trace', help="workload file written by Workload.save")
+    parser.add_argument('--containers', nargs='+', choices=sorted(REPLAY_CONTAINERS))
+    parser.add_argument('--mode', choices=('full', 'realtime'), default='full')
+    parser.add_argument('--speed', type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        workload = Workload.load(args.trace)
+        print(f"\n📼 {args.trace}: {workload.summary()}")
+        for report in compare_implementations(workload, args.containers,
+                                              args.mode, args.speed):
+            print(f"    {format_report(report)}")
+        return 0
+
+    print("🎬 WORKLOAD REPLAY - CSC 242 Week 3")
+    print("=" * 60)
+
+    demonstrate_capture_and_replay()
+
+    print(f"\n" + "=" * 60)
+    print("✅ All workload replay demonstrations complete!")
+
+    print(f"\n💡 Key Replay Concepts:")
+    print(f"   1. Record once in production, compare implementations offline")
+    print(f"   2. Op codes and offsets only - traces stay small and data-free")
+    print(f"   3. Real-time replay preserves bursts and idle gaps")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())